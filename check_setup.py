@@ -32,6 +32,17 @@ def check_package(package_name, import_name=None):
         return False
 
 
+def check_pillow_build():
+    """Report the Pillow version and whether it is the Pillow-SIMD build"""
+    try:
+        import PIL
+    except ImportError:
+        return
+    version = PIL.__version__
+    # Pillow-SIMD releases carry a .postN suffix on the Pillow version
+    build = "Pillow-SIMD" if ".post" in version else "Pillow"
+    print(f"[OK] {build} {version}")
+
 
 def _build_package_list(profile: str):
     packages = [
@@ -93,6 +104,10 @@ def main():
     missing_packages = _check_packages(packages)
     if missing_packages:
         all_good = False
+    print()
+
+    print("Checking image backend...")
+    check_pillow_build()
 
     print()
     print("=" * 70)
@@ -14,6 +14,7 @@ Workflow:
 
 import argparse
 import json
+import re
 import sys
 import time
 import os
@@ -21,7 +22,18 @@ from pathlib import Path
 from pptx import Presentation
 from PIL import Image
 import io
-from lib.extraction.pdf_extractor import prepare_pdf_for_analysis
+from lib.extraction.pdf_extractor import prepare_pdf_for_analysis, classify_slide_type
+
+# Astral-plane characters (emoji) stripped from slide titles
+_EMOJI_RE = re.compile(r'[\U00010000-\U0010ffff]')
+
+# Supported input extensions -> file type
+_EXT_TYPES = {
+    '.pptx': 'pptx',
+    '.pdf': 'pdf',
+    '.pbip': 'pbip',
+    '.pbix': 'pbix',
+}
 
 
 def extract_slide_as_image(prs, slide_idx, output_path):
@@ -41,36 +53,16 @@ def extract_slide_as_image(prs, slide_idx, output_path):
 
 def extract_slide_title(slide):
     """Extract slide title, removing emojis"""
-    import re
-
     for shape in slide.shapes:
         if hasattr(shape, 'text') and shape.text.strip():
             title = shape.text.strip()
             # Remove emoji characters
-            title = re.sub(r'[\U00010000-\U0010ffff]', '', title).strip()
+            title = _EMOJI_RE.sub('', title).strip()
             return title
 
     return "Untitled Slide"
 
 
-def classify_slide_type(title):
-    """Classify slide type for context"""
-    title_lower = title.lower()
-
-    if 'trend' in title_lower or 'over time' in title_lower:
-        return 'trends'
-    elif 'leaderboard' in title_lower or 'top' in title_lower:
-        return 'leaderboard'
-    elif 'health' in title_lower or 'overview' in title_lower:
-        return 'health_check'
-    elif 'habit' in title_lower or 'frequency' in title_lower:
-        return 'habit_formation'
-    elif 'license' in title_lower or 'priority' in title_lower:
-        return 'license_priority'
-    else:
-        return 'general'
-
-
 def detect_file_type(file_path):
     """
     Detect if file is PPTX, PDF, or PBIP based on extension / directory contents.
@@ -87,20 +79,15 @@ def detect_file_type(file_path):
     p = Path(file_path)
     suffix = p.suffix.lower()
 
-    if suffix == '.pptx':
-        return 'pptx'
-    elif suffix == '.pdf':
-        return 'pdf'
-    elif suffix == '.pbip':
-        return 'pbip'
-    elif suffix == '.pbix':
-        return 'pbix'
-    elif p.is_dir() and any(p.glob('*.pbip')):
+    file_type = _EXT_TYPES.get(suffix)
+    if file_type is not None:
+        return file_type
+    # A PBIP project folder is identified by the .pbip file inside it
+    if p.is_dir() and any(p.glob('*.pbip')):
         return 'pbip'
-    else:
-        raise ValueError(
-            f"Unsupported file type: {suffix}. Supported formats: .pptx, .pdf, .pbip, .pbix"
-        )
+    raise ValueError(
+        f"Unsupported file type: {suffix}. Supported formats: {', '.join(_EXT_TYPES)}"
+    )
 
 
 def _load_mcp_server_config() -> dict | None:
@@ -1130,7 +1117,7 @@ Examples:
     elif args.build:
         # Step 3: Build final presentation
         # Get source from request file
-        with open('temp/analysis_request.json', 'r') as f:
+        with open('temp/analysis_request.json', 'r', encoding='utf-8') as f:
             request = json.load(f)
             source_path = request['source_file']
 
@@ -5,10 +5,48 @@ The Insight class is a simple container for insights generated by Claude.
 All insight generation logic is now handled by Claude, not rule-based code.
 """
 
+from enum import IntEnum
 from typing import List, Optional
 from dataclasses import dataclass, field
 
 
+class ChartKind(IntEnum):
+    """Canonical chart type, resolved once from ChartSpec.type."""
+    UNKNOWN            = 0
+    BAR                = 1
+    BAR_STACKED        = 2
+    BAR_STACKED_100    = 3
+    COLUMN             = 4
+    COLUMN_STACKED     = 5
+    COLUMN_STACKED_100 = 6
+    LINE               = 7
+    AREA               = 8
+    PIE                = 9
+    DONUT              = 10
+    SCATTER            = 11
+    BUBBLE             = 12
+    RADAR              = 13
+    KPI                = 14
+    KPI_ROW            = 15
+    HEATMAP            = 16
+    TABLE              = 17
+    FUNNEL             = 18
+    TREEMAP            = 19
+    GAUGE              = 20
+    WATERFALL          = 21
+    COMBO              = 22
+    RIBBON             = 23
+
+
+# Type string -> ChartKind, including PBI-native and legacy aliases
+CHART_KINDS = {k.name.lower(): k for k in ChartKind if k is not ChartKind.UNKNOWN}
+CHART_KINDS.update({
+    'column_line':    ChartKind.COMBO,
+    'card':           ChartKind.KPI,
+    'multi_row_card': ChartKind.KPI_ROW,
+})
+
+
 @dataclass
 class ChartDataPoint:
     label: str
@@ -47,6 +85,11 @@ class ChartSpec:
     # gauge
     max_value: float = 100.0
     threshold: Optional[float] = None   # reference line on arc
+    # resolved from type at construction
+    kind: ChartKind = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.kind = CHART_KINDS.get((self.type or '').lower().strip(), ChartKind.UNKNOWN)
 
 
 @dataclass
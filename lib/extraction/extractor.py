@@ -42,6 +42,10 @@ class DashboardExtractor:
         'plain_number': re.compile(r'\b(\d+)\b'),
     }
 
+    # Slide boundary marker and emoji stripping, used per markdown line
+    SLIDE_NUMBER_RE = re.compile(r'Slide number:\s*(\d+)')
+    EMOJI_RE = re.compile(r'[\U00010000-\U0010ffff]')
+
     MULTIPLIERS = {
         'K': 1_000,
         'M': 1_000_000,
@@ -87,7 +91,7 @@ class DashboardExtractor:
             if 'Slide number:' in line:
                 if current_slide:
                     slides.append(current_slide)
-                slide_num_match = re.search(r'Slide number:\s*(\d+)', line)
+                slide_num_match = self.SLIDE_NUMBER_RE.search(line)
                 if slide_num_match:
                     slide_num = int(slide_num_match.group(1))
                     current_slide = {
@@ -101,7 +105,7 @@ class DashboardExtractor:
                     # Remove markdown heading markers and emoji
                     title = line.strip().lstrip('#').strip()
                     # Remove emoji characters
-                    title = re.sub(r'[\U00010000-\U0010ffff]', '', title).strip()
+                    title = self.EMOJI_RE.sub('', title).strip()
                     current_slide['title'] = title
                 else:
                     current_slide['content'].append(line)
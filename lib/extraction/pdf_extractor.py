@@ -5,11 +5,13 @@ Extracts pages from PDF files as PNG images for analysis.
 Mirrors the PPTX extraction workflow for consistent processing.
 """
 
-import json
+import hashlib
+import os
 import re
-import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 try:
     import fitz  # PyMuPDF
     _FITZ_AVAILABLE = True
@@ -24,9 +26,59 @@ except Exception:
     _PDFIUM_AVAILABLE = False
 from PIL import Image
 
+from lib import json_io
 from lib.extraction.extractor import DashboardExtractor
 from lib.extraction.text_layer_extractor import sanitize_text
 
+# zlib level for the temp PNGs written with PIL. They're read once by the
+# analysis step, so encode speed matters more than file size.
+PNG_COMPRESS_LEVEL = int(os.environ.get('PDF_PNG_LEVEL', '1'))
+
+# Mode of the page/strip PNGs handed to the assistant. "P" quantizes to an
+# adaptive 256-colour palette, roughly halving upload size; "RGB" keeps full
+# colour (these same images are embedded when building with screenshots).
+PDF_IMAGE_MODE = os.environ.get('PDF_IMAGE_MODE', 'RGB').upper()
+
+# Astral-plane characters (emoji) stripped from page titles
+_EMOJI_RE = re.compile(r'[\U00010000-\U0010ffff]')
+
+# First non-blank line of page text (rest of that line up to the newline)
+_FIRST_LINE_RE = re.compile(r'\S[^\n]*')
+
+# Render resolution for PDF pages (PDF default is 72 DPI)
+DEFAULT_RENDER_DPI = 150
+
+# Per-slide-type overrides of DEFAULT_RENDER_DPI (see classify_slide_type).
+# Off by default, since a higher DPI means more pixels to render, encode and
+# send. Opt in with e.g. PDF_SLIDE_TYPE_DPI="trends=200,leaderboard=200"
+# (trend axes and leaderboard name columns carry the smallest text).
+SLIDE_TYPE_RENDER_DPI = {
+    slide_type.strip(): int(dpi)
+    for slide_type, _, dpi in (
+        item.partition('=') for item in os.environ.get('PDF_SLIDE_TYPE_DPI', '').split(',')
+    )
+    if dpi.strip()
+}
+
+# Whole-word title keywords a page needs before its type's DPI override
+# applies. classify_slide_type matches substrings ('top' in "Desktop"),
+# which is fine for a context label but shouldn't raise the render cost.
+_RENDER_DPI_WORDS = {
+    'trends': re.compile(r'\b(?:trend(?:s|ing)?|over time)\b'),
+    'leaderboard': re.compile(r'\b(?:leaderboards?|top)\b'),
+}
+
+# Rendered pages and their text, reused across runs on the same PDF. The
+# cache lives in this subdirectory of the output directory unless a
+# cache_dir is given, and is pruned (least recently used first) back under
+# PDF_CACHE_MAX_BYTES after each run.
+PDF_CACHE_SUBDIR = 'pdf_cache'
+PDF_CACHE_MAX_BYTES = int(os.environ.get('PDF_CACHE_MAX_MB', '512')) * 1024 * 1024
+
+# Pages whose RGB bitmap would exceed this are rendered in TILE_PX tiles
+TILE_THRESHOLD_BYTES = 64 * 1024 * 1024
+TILE_PX = 1024
+
 
 def _apply_exif_correction(img: Image.Image) -> Image.Image:
     """Apply EXIF orientation metadata only (safe no-op if no EXIF present)."""
@@ -228,7 +280,38 @@ def _split_image_into_strips(img: Image.Image, n_strips: int) -> list:
     return strips
 
 
-def _extract_pdf_page_as_image_fitz(pdf_document, page_idx: int, output_path: str) -> Optional[Image.Image]:
+def _render_fitz_tiled(page, mat, zoom: float, tile_px: int = TILE_PX) -> Image.Image:
+    """
+    Render a page as tile_px-square clipped pixmaps stitched into one image.
+
+    Each tile is placed by its own pixmap origin, so rounding at tile edges
+    can't open seams between them.
+    """
+    full = (page.rect * mat).irect
+    img = Image.new("RGB", (full.width, full.height), "white")
+    step = tile_px / zoom  # tile size in page units
+    rect = page.rect
+    y = rect.y0
+    while y < rect.y1:
+        x = rect.x0
+        while x < rect.x1:
+            clip = fitz.Rect(x, y, min(x + step, rect.x1), min(y + step, rect.y1))
+            pix = page.get_pixmap(matrix=mat, clip=clip, alpha=False, colorspace=fitz.csRGB)
+            tile = Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
+            img.paste(tile, (pix.x - full.x0, pix.y - full.y0))
+            x += step
+        y += step
+    return img
+
+
+def _render_matrix(dpi: int = DEFAULT_RENDER_DPI):
+    """Build the PyMuPDF page-to-pixel matrix for rendering at ``dpi``."""
+    zoom = dpi / 72  # PDF default is 72 DPI
+    return fitz.Matrix(zoom, zoom)
+
+
+def _extract_pdf_page_as_image_fitz(pdf_document, page_idx: int, output_path: str,
+                                    matrix=None) -> Optional[Image.Image]:
     """
     Extract PDF page as PNG image (mirrors extract_slide_as_image for PPTX).
 
@@ -236,6 +319,8 @@ def _extract_pdf_page_as_image_fitz(pdf_document, page_idx: int, output_path: st
         pdf_document: PyMuPDF document object
         page_idx: Page index (0-based)
         output_path: Path to save PNG image
+        matrix: Shared render matrix built once per DPI by the caller
+            (defaults to DEFAULT_RENDER_DPI)
 
     Returns:
         PIL Image if successful, None on failure
@@ -248,24 +333,31 @@ def _extract_pdf_page_as_image_fitz(pdf_document, page_idx: int, output_path: st
 
         # Render page at 150 DPI (balance between quality and file size)
         # Power BI exports are typically high-resolution, 150 DPI is sufficient
-        zoom = 150 / 72  # PDF default is 72 DPI
-        mat = fitz.Matrix(zoom, zoom)
-
-        # Render page to pixmap
-        pix = page.get_pixmap(matrix=mat, alpha=False)
+        mat = matrix if matrix is not None else _render_matrix()
+        zoom = mat.a
+
+        full = page.rect * mat
+        if full.width * full.height * 3 > TILE_THRESHOLD_BYTES:
+            # Very large page: render in clipped tiles so only one tile's
+            # pixmap is alive next to the stitched image
+            img = _render_fitz_tiled(page, mat, zoom)
+            img.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
+        else:
+            # Render page to pixmap
+            pix = page.get_pixmap(matrix=mat, alpha=False, colorspace=fitz.csRGB)
 
-        # Convert to PIL Image
-        img_data = pix.tobytes("png")
-        img = Image.open(io.BytesIO(img_data))
+            # Save as PNG straight from MuPDF, and load the raw samples for the
+            # caller rather than round-tripping through PNG bytes and PIL decode.
+            # samples_mv is a view of the pixmap's own buffer, so PIL copies the
+            # pixels once instead of via an intermediate bytes object.
+            pix.save(output_path)
+            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
 
         # Apply EXIF correction only — geometric rotation is NOT applied here.
         # Portrait pages with scrollable dashboard content are split into strips
         # by the caller; rotating them would make the text unreadable.
         img = _apply_exif_correction(img)
 
-        # Save as PNG
-        img.save(output_path)
-
         return img  # Return image so caller can split if needed
 
     except Exception as e:
@@ -273,20 +365,21 @@ def _extract_pdf_page_as_image_fitz(pdf_document, page_idx: int, output_path: st
         return None
 
 
-def _extract_pdf_page_as_image_pdfium(pdf_document, page_idx: int, output_path: str) -> Optional[Image.Image]:
+def _extract_pdf_page_as_image_pdfium(pdf_document, page_idx: int, output_path: str,
+                                      dpi: int = DEFAULT_RENDER_DPI) -> Optional[Image.Image]:
     """Render PDF page using pypdfium2 (preferred if available)."""
     try:
         if page_idx >= len(pdf_document):
             return False
 
         page = pdf_document[page_idx]
-        # Render at ~150 DPI
-        scale = 150 / 72
+        # Render at ~150 DPI unless the slide type asks for more
+        scale = dpi / 72
         bitmap = page.render(scale=scale)
         pil_image = bitmap.to_pil()
 
         pil_image = _apply_exif_correction(pil_image)
-        pil_image.save(output_path)
+        pil_image.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
         return pil_image
     except Exception as e:
         print(f"  WARNING: Failed to extract page {page_idx + 1}: {e}")
@@ -315,15 +408,13 @@ def extract_pdf_page_title_from_text(text: str, page_idx: int) -> str:
 
     Returns first non-empty line or "Page N".
     """
-    if not text or not text.strip():
+    # Only the first non-empty line is needed, so find it directly instead
+    # of splitting and stripping every line of the page text
+    first_line = _FIRST_LINE_RE.search(text) if text else None
+    if first_line is None:
         return f"Page {page_idx + 1}"
 
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    if not lines:
-        return f"Page {page_idx + 1}"
-
-    title = lines[0]
-    title = re.sub(r'[\U00010000-\U0010ffff]', '', title).strip()
+    title = _EMOJI_RE.sub('', first_line.group().strip()).strip()
     if not title:
         return f"Page {page_idx + 1}"
 
@@ -356,7 +447,156 @@ def classify_slide_type(title: str) -> str:
         return 'general'
 
 
-def prepare_pdf_for_analysis(source_path: str, use_text_layer: bool = False) -> str:
+def _page_render_dpi(title: str) -> int:
+    """Render DPI for a page: its slide type's override, or the default."""
+    slide_type = classify_slide_type(title)
+    dpi = SLIDE_TYPE_RENDER_DPI.get(slide_type)
+    if dpi is None:
+        return DEFAULT_RENDER_DPI
+    words = _RENDER_DPI_WORDS.get(slide_type)
+    if words is not None and not words.search(title.lower()):
+        return DEFAULT_RENDER_DPI
+    return dpi
+
+
+def _pdf_cache_key(source_path: str, backend: str) -> str:
+    """
+    Content hash of the PDF plus the backend. Render DPI also affects the
+    pixels but can vary per page, so it goes in each cached image's name.
+    """
+    h = hashlib.sha1()
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return f"{h.hexdigest()[:16]}_{backend}"
+
+
+def _cache_store(src: str, dest: Path):
+    """Copy src into the cache via a temp name so readers never see a partial file."""
+    try:
+        tmp = dest.with_suffix(dest.suffix + '.tmp')
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except OSError:
+        pass
+
+
+def _cache_store_text(text: str, dest: Path):
+    """Write text into the cache via a temp name, like _cache_store."""
+    try:
+        tmp = dest.with_suffix(dest.suffix + '.tmp')
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, dest)
+    except OSError:
+        pass
+
+
+def _cache_touch(path: Path):
+    """Mark a cache entry as just used so pruning keeps it."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _prune_pdf_cache(cache_dir: Path, keep_prefix: str):
+    """
+    Delete least recently used cache files until the cache fits
+    PDF_CACHE_MAX_BYTES.
+    Files of the PDF just processed (keep_prefix) are never removed.
+    """
+    entries = []
+    try:
+        for e in os.scandir(cache_dir):
+            if e.is_file():
+                st = e.stat()
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= PDF_CACHE_MAX_BYTES:
+            break
+        if os.path.basename(path).startswith(keep_prefix):
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _split_and_save_page(img: Image.Image, page_idx: int, title: str, page_text: str,
+                         raw_path: str, extractor: Optional[DashboardExtractor],
+                         out_dir: str = 'temp', mode: str = 'RGB'):
+    """
+    Trim, split and save one rendered page; safe to run on a worker thread.
+
+    Returns (n_strips, page_infos) where each page_info still needs its
+    'slide_number'. Text metrics are extracted only when extractor is given.
+    """
+    # Trim blank background rows before computing strip count.
+    # Pages with sparse content (e.g. a glossary in the bottom 35% of the
+    # page) would otherwise split into a mostly-blank strip + content strip.
+    # After trimming, the content height may fit in a single strip.
+    bg = _detect_background_brightness(img)
+    img = _trim_background_rows(img, bg)
+
+    # Determine how many 16:9 strips this page should be split into
+    n_strips = _compute_n_strips(img)
+    strips = _split_image_into_strips(img, n_strips)
+
+    text_metrics = []
+    text_key_phrases = []
+    if extractor is not None:
+        text_metrics = [
+            {
+                'value': m.value,
+                'numeric_value': m.numeric_value,
+                'context': m.context,
+                'metric_type': m.metric_type,
+            }
+            for m in extractor._extract_metrics(page_text)
+        ]
+        text_key_phrases = extractor._extract_key_phrases(page_text)
+
+    page_infos = []
+    for strip_idx, strip_img in enumerate(strips):
+        # Build strip title and image path
+        if n_strips > 1:
+            strip_title = f"{title} (Part {strip_idx + 1} of {n_strips})"
+            image_path = f"{out_dir}/page_{page_idx + 1}_strip{strip_idx + 1}.png"
+        else:
+            strip_title = title
+            image_path = f"{out_dir}/page_{page_idx + 1}.png"
+
+        if mode == 'P':
+            strip_img = strip_img.convert('P', palette=Image.Palette.ADAPTIVE, colors=256)
+            strip_img.save(image_path, optimize=True)
+        else:
+            strip_img.save(image_path, compress_level=PNG_COMPRESS_LEVEL)
+
+        page_infos.append({
+            'slide_number': None,
+            'title': strip_title,
+            'image_path': image_path,
+            'slide_type': classify_slide_type(title),
+            'text_layer': page_text,
+            'text_metrics': list(text_metrics),
+            'text_key_phrases': list(text_key_phrases),
+        })
+
+    # Clean up raw file if strips were saved separately
+    if n_strips > 1:
+        Path(raw_path).unlink(missing_ok=True)
+
+    return n_strips, page_infos
+
+
+def prepare_pdf_for_analysis(source_path: str, use_text_layer: bool = False,
+                             output_dir: Union[str, Path] = 'temp',
+                             image_mode: str = None,
+                             cache_dir: Union[str, Path] = None) -> str:
     """
     Prepare PDF pages for analysis (mirrors prepare_for_analysis for PPTX).
 
@@ -366,6 +606,13 @@ def prepare_pdf_for_analysis(source_path: str, use_text_layer: bool = False) ->
 
     Args:
         source_path: Path to source PDF file
+        use_text_layer: Also extract text metrics/key phrases for each page
+        output_dir: Directory for page images and analysis_request.json
+            (default: temp)
+        image_mode: "RGB" or "P" (256-colour palette) for the saved page
+            images (default: PDF_IMAGE_MODE)
+        cache_dir: Directory for the rendered-page cache (default:
+            output_dir/pdf_cache)
 
     Returns:
         Path to analysis_request.json file
@@ -374,13 +621,8 @@ def prepare_pdf_for_analysis(source_path: str, use_text_layer: bool = False) ->
     print("PREPARING PDF PAGES FOR ANALYSIS")
     print("=" * 70)
 
-    pdf_doc = None
-    if _FITZ_AVAILABLE:
-        try:
-            pdf_doc = fitz.open(source_path)
-        except Exception:
-            pdf_doc = None
-
+    # Open the PDF once, with a single backend: pypdfium2 is preferred, and
+    # PyMuPDF is only parsed when pdfium is missing or can't read the file
     pdfium_doc = None
     if _PDFIUM_AVAILABLE:
         try:
@@ -388,121 +630,128 @@ def prepare_pdf_for_analysis(source_path: str, use_text_layer: bool = False) ->
         except Exception:
             pdfium_doc = None
 
+    pdf_doc = None
+    if pdfium_doc is None and _FITZ_AVAILABLE:
+        try:
+            pdf_doc = fitz.open(source_path)
+        except Exception:
+            pdf_doc = None
+
     if pdf_doc is None and pdfium_doc is None:
         raise IOError(f"Failed to open PDF file '{source_path}': no PDF backend available")
 
+    try:
+        if cache_dir is None:
+            cache_dir = Path(output_dir) / PDF_CACHE_SUBDIR
+        return _prepare_pdf_pages(source_path, pdf_doc, pdfium_doc, use_text_layer,
+                                  str(output_dir), image_mode, Path(cache_dir))
+    finally:
+        if pdf_doc is not None:
+            pdf_doc.close()
+        if pdfium_doc is not None:
+            try:
+                pdfium_doc.close()
+            except Exception:
+                pass
+
+
+def _prepare_pdf_pages(source_path: str, pdf_doc, pdfium_doc, use_text_layer: bool,
+                       out_dir: str, image_mode: Optional[str], cache_dir: Path) -> str:
+    """Body of prepare_pdf_for_analysis, run against the already-open document."""
     page_count = len(pdfium_doc) if pdfium_doc is not None else len(pdf_doc)
     if page_count == 0:
         raise ValueError(f"PDF file '{source_path}' is empty (0 pages)")
 
-    # Create temp directory for images
-    Path('temp').mkdir(exist_ok=True)
+    # Create output directory for images
+    image_mode = (image_mode or PDF_IMAGE_MODE).upper()
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_key = _pdf_cache_key(source_path, 'pdfium' if pdfium_doc is not None else 'fitz')
 
     pages_to_analyze = []
 
     print(f"\nExtracting all {page_count} pages from PDF...")
     print("  (PDF exports typically have dashboard content on page 1)")
 
-    slide_counter = 0  # Sequential slide number across all pages and strips
-
     extractor = DashboardExtractor()
-
-    for page_idx in range(page_count):
-        # Include all pages for PDF (unlike PPTX which skips cover page)
-        if pdfium_doc is not None:
-            page_text = _extract_pdf_page_text_pdfium(pdfium_doc, page_idx)
-        else:
-            page = pdf_doc[page_idx]
-            page_text = _extract_pdf_page_text_fitz(page)
-
-        page_text = sanitize_text(page_text)
-        title = extract_pdf_page_title_from_text(page_text, page_idx)
-        raw_path = f"temp/page_{page_idx + 1}_raw.png"
-
-        # Extract page as image (EXIF-corrected, no rotation)
-        if pdfium_doc is not None:
-            img = _extract_pdf_page_as_image_pdfium(pdfium_doc, page_idx, raw_path)
-        else:
-            img = _extract_pdf_page_as_image_fitz(pdf_doc, page_idx, raw_path)
-
-        if img is None:
-            continue
-
-        # Trim blank background rows before computing strip count.
-        # Pages with sparse content (e.g. a glossary in the bottom 35% of the
-        # page) would otherwise split into a mostly-blank strip + content strip.
-        # After trimming, the content height may fit in a single strip.
-        bg = _detect_background_brightness(img)
-        img = _trim_background_rows(img, bg)
-
-        # Determine how many 16:9 strips this page should be split into
-        n_strips = _compute_n_strips(img)
-        strips = _split_image_into_strips(img, n_strips)
-
-        strip_label = f" ({n_strips} strips)" if n_strips > 1 else ""
-        print(f"  OK Page {page_idx + 1}: {title[:40]}...{strip_label}")
-
-        for strip_idx, strip_img in enumerate(strips):
-            slide_counter += 1
-
-            # Build strip title and image path
-            if n_strips > 1:
-                strip_title = f"{title} (Part {strip_idx + 1} of {n_strips})"
-                image_path = f"temp/page_{page_idx + 1}_strip{strip_idx + 1}.png"
+    # One fitz render matrix per DPI, shared by every page that uses it
+    # rather than rebuilt per page
+    render_matrices = {}
+
+    # PDF backends aren't thread-safe, so text extraction and rendering stay
+    # on this thread; each rendered page's trim/split/PNG encode then runs in
+    # the pool, overlapping with rendering of the pages after it.
+    pending = []
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, page_count)) as pool:
+        for page_idx in range(page_count):
+            cached_txt = cache_dir / f"{cache_key}_{page_idx + 1}.txt"
+            raw_path = f"{out_dir}/page_{page_idx + 1}_raw.png"
+
+            # Include all pages for PDF (unlike PPTX which skips cover page)
+            if cached_txt.is_file():
+                page_text = cached_txt.read_text(encoding='utf-8')
+                _cache_touch(cached_txt)
             else:
-                strip_title = title
-                image_path = f"temp/page_{page_idx + 1}.png"
-
-            strip_img.save(image_path)
-
-            page_info = {
-                'slide_number': slide_counter,
-                'title': strip_title,
-                'image_path': image_path,
-                'slide_type': classify_slide_type(title),
-                'text_layer': page_text,
-                'text_metrics': [],
-                'text_key_phrases': [],
-            }
-            if use_text_layer:
-                metrics = extractor._extract_metrics(page_text)
-                key_phrases = extractor._extract_key_phrases(page_text)
-                page_info['text_metrics'] = [
-                    {
-                        'value': m.value,
-                        'numeric_value': m.numeric_value,
-                        'context': m.context,
-                        'metric_type': m.metric_type,
-                    }
-                    for m in metrics
-                ]
-                page_info['text_key_phrases'] = key_phrases
-            pages_to_analyze.append(page_info)
-
-        # Clean up raw file if strips were saved separately
-        import os
-        if n_strips > 1 and Path(raw_path).exists():
-            os.remove(raw_path)
-
-    # Close PDF document
-    if pdf_doc is not None:
-        pdf_doc.close()
-    if pdfium_doc is not None:
-        try:
-            pdfium_doc.close()
-        except Exception:
-            pass
+                if pdfium_doc is not None:
+                    page_text = _extract_pdf_page_text_pdfium(pdfium_doc, page_idx)
+                else:
+                    page_text = _extract_pdf_page_text_fitz(pdf_doc[page_idx])
+                page_text = sanitize_text(page_text)
+                _cache_store_text(page_text, cached_txt)
+
+            title = extract_pdf_page_title_from_text(page_text, page_idx)
+            dpi = _page_render_dpi(title)
+            cached_png = cache_dir / f"{cache_key}_{page_idx + 1}_{dpi}.png"
+
+            # Extract page as image (EXIF-corrected, no rotation)
+            img = None
+            if cached_png.is_file():
+                try:
+                    shutil.copyfile(cached_png, raw_path)
+                    img = Image.open(raw_path)
+                    img.load()
+                    _cache_touch(cached_png)
+                except Exception:
+                    img = None
+            if img is None:
+                if pdfium_doc is not None:
+                    img = _extract_pdf_page_as_image_pdfium(pdfium_doc, page_idx, raw_path, dpi)
+                else:
+                    if dpi not in render_matrices:
+                        render_matrices[dpi] = _render_matrix(dpi)
+                    img = _extract_pdf_page_as_image_fitz(pdf_doc, page_idx, raw_path,
+                                                          render_matrices[dpi])
+                if img is None:
+                    continue
+                _cache_store(raw_path, cached_png)
+
+            pending.append((page_idx, title, pool.submit(
+                _split_and_save_page, img, page_idx, title, page_text, raw_path,
+                extractor if use_text_layer else None, out_dir, image_mode)))
+
+        # Collect in page order so slide numbers run sequentially across all
+        # pages and strips
+        slide_counter = 0
+        for page_idx, title, future in pending:
+            n_strips, page_infos = future.result()
+            strip_label = f" ({n_strips} strips)" if n_strips > 1 else ""
+            print(f"  OK Page {page_idx + 1}: {title[:40]}...{strip_label}")
+            for page_info in page_infos:
+                slide_counter += 1
+                page_info['slide_number'] = slide_counter
+                pages_to_analyze.append(page_info)
+
+    _prune_pdf_cache(cache_dir, cache_key)
 
     # Save analysis request (identical structure to PPTX version)
-    request_file = 'temp/analysis_request.json'
-    with open(request_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'source_file': source_path,
-            'source_type': 'pdf',
-            'total_slides': len(pages_to_analyze),
-            'slides': pages_to_analyze,
-            'text_layer_used': use_text_layer,
-        }, f, indent=2)
+    request_file = f"{out_dir}/analysis_request.json"
+    json_io.write(request_file, {
+        'source_file': source_path,
+        'source_type': 'pdf',
+        'total_slides': len(pages_to_analyze),
+        'slides': pages_to_analyze,
+        'text_layer_used': use_text_layer,
+    })
 
     print(f"\nOK Prepared {len(pages_to_analyze)} pages for analysis")
     print(f"OK Analysis request saved to: {request_file}")
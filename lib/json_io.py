@@ -0,0 +1,37 @@
+"""
+JSON helpers shared by the pipeline and setup scripts.
+
+Uses orjson when installed, falling back to the standard json module.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson  # optional fast JSON codec
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes):
+    """Parse JSON straight from bytes; both codecs skip a separate decode."""
+    return orjson.loads(data) if _ORJSON_AVAILABLE else json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize with 2-space indent to UTF-8 bytes."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def write(path, obj):
+    """Write obj to path as 2-space-indented UTF-8 JSON."""
+    if _ORJSON_AVAILABLE:
+        Path(path).write_bytes(dumps(obj))
+        return
+    # json.dump streams into the file instead of building one big string
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(obj, fh, indent=2)
@@ -13,9 +13,11 @@ from pptx.dml.color import RGBColor
 from lib.analysis.insights import Insight, BulletPoint
 from PIL import Image
 import io
+import re
 
 try:
     from lib.rendering.chart_builder_mpl import render_chart_to_png as _mpl_render
+    from lib.rendering.chart_builder_mpl import render_charts_to_png as _mpl_render_batch
     _MPL_AVAILABLE = True
 except ImportError:
     _MPL_AVAILABLE = False
@@ -30,6 +32,9 @@ _TEXT_WIDTH  = Inches(7.93)
 _ROW_TOPS    = [Inches(1.50), Inches(3.15), Inches(4.80)]
 _ROW_H       = Inches(1.55)
 
+# Astral-plane characters (emoji) stripped from source slide titles
+_EMOJI_RE = re.compile(r'[\U00010000-\U0010ffff]')
+
 
 def _normalize_image_orientation(image: Image.Image) -> Image.Image:
     """
@@ -599,6 +604,33 @@ class SlideBuilder:
         self._add_bottom_accent_line(slide)
         return slide
 
+    def prerender_charts(self, insights: List[Insight]):
+        """
+        Render every chart add_polished_chart_slide will need in one batch.
+
+        Large batches render in parallel worker processes; either way the
+        charts land in the mpl PNG cache, so the per-slide renders that
+        follow are cache hits. Sizes
+        mirror the 1-chart and 2-chart layouts below.
+        """
+        if not _MPL_AVAILABLE:
+            return
+        MARGIN   = Inches(0.25)
+        USABLE_W = self.style.SLIDE_WIDTH - 2 * MARGIN
+        cw       = (USABLE_W - Inches(0.15)) // 2
+
+        jobs = []
+        for insight in insights:
+            specs = [bp.chart for bp in insight.bullet_points
+                     if getattr(bp, 'chart', None) is not None][:2]
+            if len(specs) == 1:
+                jobs.append((specs[0], Inches(7.10) / 914400, Inches(6.10) / 914400))
+            else:
+                jobs.extend((spec, cw / 914400, Inches(3.65) / 914400)
+                            for spec in specs)
+        if len(jobs) > 1:
+            _mpl_render_batch(jobs, dpi=200)
+
     def add_polished_chart_slide(
         self,
         slide_number: int,
@@ -1251,7 +1283,9 @@ def render_presentation(
             file_type in ('.pbip', '.pbix', '.pdf') or Path(source_path).is_dir()
         ) and not use_vector
 
-        # Process insights - iterate by slide number for guaranteed order
+        # Match insights to slides first so only charts for slides that
+        # are actually built get pre-rendered
+        matched = []
         for slide_num in sorted(source_images_map.keys()):
             slide_info = slide_info_map.get(slide_num)
             if not slide_info:
@@ -1273,6 +1307,13 @@ def render_presentation(
                             insight = val
                             break
 
+            matched.append((slide_num, slide_info, insight))
+
+        if not use_screenshots:
+            builder.prerender_charts([insight for _, _, insight in matched if insight])
+
+        # Process insights - iterate by slide number for guaranteed order
+        for slide_num, slide_info, insight in matched:
             if insight:
                 # Resolve screenshot path
                 image_path = source_images_map.get(slide_num)
@@ -1322,6 +1363,7 @@ def render_presentation(
                 print(f"  WARNING: No insight found for slide {slide_num}: {title}")
     else:
         # PPTX workflow: Original logic
+        matched = []
         for slide_idx, slide in enumerate(source_prs.slides):
             # Extract slide title (first shape with text, typically)
             slide_title = ""
@@ -1331,41 +1373,44 @@ def render_presentation(
                     break
 
             # Remove emoji characters to match parsed titles
-            import re
-            slide_title_clean = re.sub(r'[\U00010000-\U0010ffff]', '', slide_title).strip()
+            slide_title_clean = _EMOJI_RE.sub('', slide_title).strip()
 
             # Find matching insight — try slide_number key first (integer),
             # then fall back to title string for backward compatibility
             insight = insights.get(slide_idx + 1) or insights.get(slide_title_clean)
-
             if insight:
-                # Extract image from source slide and normalize orientation
-                source_image = extract_slide_image(source_prs, slide_idx)
-                if source_image:
-                    source_image = _normalize_image_orientation(source_image)
-
-                # Determine whether to use chart-row layout or image-left layout
-                has_charts = any(
-                    hasattr(bp, 'chart') and bp.chart is not None
+                matched.append((slide_idx, insight))
+
+        builder.prerender_charts([insight for _, insight in matched])
+
+        for slide_idx, insight in matched:
+            # Extract image from source slide and normalize orientation
+            source_image = extract_slide_image(source_prs, slide_idx)
+            if source_image:
+                source_image = _normalize_image_orientation(source_image)
+
+            # Determine whether to use chart-row layout or image-left layout
+            has_charts = any(
+                hasattr(bp, 'chart') and bp.chart is not None
+                for bp in insight.bullet_points
+            )
+            if has_charts:
+                builder.add_polished_chart_slide(
+                    slide_number=slide_idx + 1,
+                    headline=insight.headline,
+                    bullet_points=insight.bullet_points
+                )
+            else:
+                plain = [
+                    bp.text if hasattr(bp, 'text') else str(bp)
                     for bp in insight.bullet_points
+                ]
+                builder.add_insight_slide(
+                    slide_number=slide_idx + 1,
+                    headline=insight.headline,
+                    insights=plain,
+                    source_image=source_image
                 )
-                if has_charts:
-                    builder.add_polished_chart_slide(
-                        slide_number=slide_idx + 1,
-                        headline=insight.headline,
-                        bullet_points=insight.bullet_points
-                    )
-                else:
-                    plain = [
-                        bp.text if hasattr(bp, 'text') else str(bp)
-                        for bp in insight.bullet_points
-                    ]
-                    builder.add_insight_slide(
-                        slide_number=slide_idx + 1,
-                        headline=insight.headline,
-                        insights=plain,
-                        source_image=source_image
-                    )
 
     # Add recommendations slide (if provided)
     if '__recommendations__' in insights:
@@ -9,15 +9,30 @@ that python-pptx renders coarsely (scatter, bubble, treemap, funnel, gauge).
 Both renderers coexist. builder.py routes to this module when use_mpl=True.
 """
 
+import functools
+import hashlib
 import io
 import math
+import os
+import pickle
+import threading
+from collections import OrderedDict
 import matplotlib
 matplotlib.use('Agg')          # headless — no display server needed
-import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
 import numpy as np
+from PIL import Image
+try:
+    import fpnge  # optional SIMD PNG encoder
+    _FPNGE_AVAILABLE = True
+except Exception:
+    fpnge = None
+    _FPNGE_AVAILABLE = False
 
-from lib.analysis.insights import ChartSpec
+from lib.analysis.insights import ChartKind, ChartSpec
 
 # ---------------------------------------------------------------------------
 # PBI-matching color palettes (hex strings for matplotlib)
@@ -46,44 +61,212 @@ MULTI_PAL = [
     PBI_PINK_DARK, PBI_PURPLE_MID, PBI_BLUE_MID,
 ]
 HABIT_PAL = ["#C3C3C3", PBI_BLUE_LIGHT, PBI_BLUE, PBI_BLUE_DARK]
+HEATMAP_CMAP = matplotlib.colormaps['Blues']
+
+# PBI-style axes defaults for the cartesian renderers (the ones that call
+# _style_ax). _render_chart applies them with rc_context around just those
+# renderers, so their Axes are created already styled while matplotlib's
+# global defaults stay untouched for the other charts and the rest of the
+# process.
+_PBI_AXES_RC = {
+    'axes.spines.top':   False,
+    'axes.spines.right': False,
+    'axes.spines.left':  False,
+    'axes.edgecolor':    LIGHT_GRAY,
+    'grid.color':        GRID_GRAY,
+    'grid.linewidth':    0.5,
+    'grid.alpha':        0.8,
+    'xtick.color':       DARK_GRAY,
+    'ytick.color':       DARK_GRAY,
+    'xtick.labelcolor':  DARK_GRAY,
+    'ytick.labelcolor':  DARK_GRAY,
+    'xtick.labelsize':   8,
+    'ytick.labelsize':   8,
+}
 
 
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-def _get_fig(w_in: float, h_in: float):
-    return plt.figure(figsize=(w_in, h_in), facecolor='white', dpi=100)
+# One Figure + Agg canvas per thread, cleared and resized for each chart
+# instead of building (and tearing down) a new figure every render.
+_FIG_CACHE = threading.local()
+_SUBPLOT_KEYS = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
 
 
-def _to_png(fig, dpi: int = 200) -> bytes:
+def _get_fig(w_in: float, h_in: float):
+    fig = getattr(_FIG_CACHE, 'fig', None)
+    if fig is None:
+        fig = Figure(figsize=(w_in, h_in), facecolor='white', dpi=100)
+        FigureCanvasAgg(fig)
+        _FIG_CACHE.fig = fig
+        return fig
+    fig.clear()
+    fig.set_dpi(100)
+    fig.set_size_inches(w_in, h_in, forward=False)
+    # clear() keeps subplot margins; restore the defaults a new figure gets
+    fig.subplots_adjust(**{k: matplotlib.rcParams[f'figure.subplot.{k}']
+                           for k in _SUBPLOT_KEYS})
+    return fig
+
+
+def _to_png(fig, dpi: int = 200, pad_in: float = 0.1) -> bytes:
+    """
+    Rasterize once on the Agg canvas, crop to the tight bbox and encode.
+
+    Equivalent to savefig(bbox_inches='tight') without its second draw pass
+    or PIL's default zlib level; fpnge is used when installed. Content
+    spilling outside the figure needs the enlarged re-render, so that case
+    still goes through savefig.
+    """
+    fig.set_dpi(dpi)
+    canvas = fig.canvas
+    canvas.draw()
+    tight = fig.get_tightbbox(canvas.get_renderer())
+    fw, fh = fig.get_size_inches()
+    if tight.x0 < 0 or tight.y0 < 0 or tight.x1 > fw or tight.y1 > fh:
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
+                    pad_inches=pad_in, facecolor='white', edgecolor='none',
+                    pil_kwargs={'compress_level': 1})
+        return buf.getvalue()
+
+    bbox = tight.padded(pad_in)
+    rgba = np.asarray(canvas.buffer_rgba())
+    h_px, w_px = rgba.shape[:2]
+    # Crop window in pixel rows/cols; the padding may extend past the
+    # canvas edge and is filled with the white background.
+    x0 = int(round(bbox.x0 * dpi))
+    x1 = x0 + int(bbox.width * dpi)
+    y0 = h_px - int(round(bbox.y1 * dpi))
+    y1 = y0 + int(bbox.height * dpi)
+    img = np.full((y1 - y0, x1 - x0, 4), 255, dtype=np.uint8)
+    sx0, sx1 = max(x0, 0), min(x1, w_px)
+    sy0, sy1 = max(y0, 0), min(y1, h_px)
+    img[sy0 - y0:sy1 - y0, sx0 - x0:sx1 - x0] = rgba[sy0:sy1, sx0:sx1]
+    if _FPNGE_AVAILABLE:
+        return fpnge.fromNP(img)
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close(fig)
+    Image.fromarray(img, 'RGBA').save(buf, format='PNG', compress_level=1)
     return buf.getvalue()
 
 
 def _style_ax(ax, grid='y', bottom_spine=True):
-    """Clean PBI-style axes: no top/right/left spine, light gray grid."""
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['left'].set_visible(False)
-    ax.spines['bottom'].set_color(LIGHT_GRAY)
-    ax.spines['bottom'].set_visible(bottom_spine)
-    if grid == 'both':
-        ax.grid(axis='x', color=GRID_GRAY, linewidth=0.5, alpha=0.8, zorder=0)
-        ax.grid(axis='y', color=GRID_GRAY, linewidth=0.5, alpha=0.8, zorder=0)
-    elif grid:
-        ax.grid(axis=grid, color=GRID_GRAY, linewidth=0.5, alpha=0.8, zorder=0)
-    ax.tick_params(colors=DARK_GRAY, labelsize=8)
-
-
-def _hex_to_mpl(h: str) -> str:
-    """Validate and return hex color; fall back to PBI_BLUE."""
-    if h and isinstance(h, str) and h.startswith('#') and len(h) == 7:
-        return h
-    return PBI_BLUE
+    """
+    Clean PBI-style axes: light gray grid on the given axis.
+    Spine and tick styling comes from _PBI_AXES_RC.
+    """
+    if not bottom_spine:
+        ax.spines['bottom'].set_visible(False)
+    if grid:
+        ax.grid(axis=grid, zorder=0)
+
+
+def _apply_xticks(ax, labels, fs: int = 8, rot_len: int = 6,
+                  max_ticks: int = 20):
+    """
+    Category x-ticks with PBI-style rotation.
+
+    Labels longer than ``rot_len`` rotate 30°. Past ``max_ticks`` labels only
+    every Nth tick is kept, so a long axis doesn't build one Text per point.
+    """
+    n = len(labels)
+    step = -(-n // max_ticks) if n > max_ticks else 1
+    shown = labels[::step]
+    max_len = max(map(len, shown), default=0)
+    rot = 30 if max_len > rot_len else 0
+    ax.set_xticks(range(0, n, step))
+    ax.set_xticklabels(shown, fontsize=fs, rotation=rot,
+                       ha='right' if rot else 'center')
+    if rot:
+        return _TICK_IN + 0.5 * _text_in(shown, fs) + 0.87 * fs / 72
+    return _TICK_IN + 1.4 * fs / 72
+
+
+# ---------------------------------------------------------------------------
+# Fixed layout — margins are estimated from label lengths instead of running
+# tight_layout's measuring pass on every chart.
+# ---------------------------------------------------------------------------
+
+_TICK_IN  = 0.15    # tick mark + label pad, inches
+_TITLE_IN = 0.25    # 9pt axes title + pad, inches
+
+
+def _text_in(labels, fs: float = 8) -> float:
+    """Approximate width in inches of the longest label at ``fs`` points."""
+    return max(map(len, labels), default=0) * fs * 0.6 / 72
+
+
+def _num_in(vmax: float, fs: float = 8) -> float:
+    """Approximate width in inches of numeric tick labels up to ``vmax``."""
+    try:
+        digits = len(f"{abs(vmax):.0f}")
+    except (TypeError, ValueError, OverflowError):
+        digits = 4
+    return _TICK_IN + (digits + 1) * fs * 0.6 / 72
+
+
+def _set_margins(fig, left: float = 0.1, right: float = 0.1,
+                 top: float = 0.1, bottom: float = 0.1, title: str = ''):
+    """Fixed subplot margins in inches; a title reserves room above the axes."""
+    w, h = fig.get_size_inches()
+    if title:
+        top += _TITLE_IN
+    l = min(left / w, 0.45)
+    r = max(1 - right / w, l + 0.1)
+    b = min(bottom / h, 0.45)
+    t = max(1 - top / h, b + 0.1)
+    fig.subplots_adjust(left=l, right=r, bottom=b, top=t)
+
+
+def _parse_hex(h: str) -> tuple:
+    """'#RRGGBB' -> (r, g, b) floats in [0, 1]; raises ValueError if malformed."""
+    return tuple(int(h[i:i + 2], 16) / 255.0 for i in (1, 3, 5))
+
+
+# Parsed RGB per hex string — palette entries seeded at import, spec colors
+# added on first use so repeated lookups are a single dict hit.
+_RGB_CACHE: dict = {c: _parse_hex(c) for c in (
+    PBI_BLUE_DARK, PBI_BLUE, PBI_BLUE_MID, PBI_BLUE_LIGHT,
+    PBI_PURPLE_DARK, PBI_PURPLE, PBI_PURPLE_MID, PBI_PURPLE_LIGHT,
+    PBI_PINK_DARK, PBI_PINK, PBI_PINK_MID, PBI_PINK_LIGHT,
+    DARK_GRAY, MID_GRAY, LIGHT_GRAY, GRID_GRAY, WHITE,
+)}
+
+
+def _hex_to_mpl(h: str) -> tuple:
+    """Validate hex color and return it as an RGB tuple; fall back to PBI_BLUE."""
+    if not isinstance(h, str):
+        return _RGB_CACHE[PBI_BLUE]
+    rgb = _RGB_CACHE.get(h)
+    if rgb is not None:
+        return rgb
+    if len(h) == 7 and h[0] == '#':
+        try:
+            rgb = _RGB_CACHE[h] = _parse_hex(h)
+            return rgb
+        except ValueError:
+            pass
+    return _RGB_CACHE[PBI_BLUE]
+
+
+def _pivot_series(series):
+    """
+    Pivot long-format ``{label, series, value}`` items into a matrix.
+
+    Returns (cat_order, ser_names, mat) where ``mat[i, j]`` is the value of
+    series ``ser_names[i]`` at category ``cat_order[j]`` (0.0 when absent).
+    """
+    cat_order = list(dict.fromkeys(s.get('label', '') for s in series))
+    ser_names = list(dict.fromkeys(s.get('series', '') for s in series))
+    cat_idx = {c: j for j, c in enumerate(cat_order)}
+    ser_idx = {sn: i for i, sn in enumerate(ser_names)}
+    mat = np.zeros((len(ser_names), len(cat_order)))
+    for item in series:
+        mat[ser_idx[item.get('series', '')], cat_idx[item.get('label', '')]] = \
+            float(item.get('value', 0))
+    return cat_order, ser_names, mat
 
 
 def _point_colors(data, highlight: str) -> list:
@@ -105,13 +288,20 @@ def _point_colors(data, highlight: str) -> list:
 def _render_placeholder(spec: ChartSpec, w: float, h: float, dpi: int,
                          error: str = "") -> bytes:
     """Gray box with chart type label — shown for unknown or failed types."""
+    return _placeholder_bytes(spec.type or 'unknown', error[:60], w, h, dpi)
+
+
+@functools.lru_cache(maxsize=64)
+def _placeholder_bytes(type_str: str, error: str, w: float, h: float,
+                       dpi: int) -> bytes:
+    """Placeholder PNG, memoized — output depends only on these arguments."""
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     ax.set_facecolor('#F5F5F5')
     ax.set_axis_off()
-    msg = f"Chart: {spec.type or 'unknown'}"
+    msg = f"Chart: {type_str}"
     if error:
-        msg += f"\n({error[:60]})"
+        msg += f"\n({error})"
     ax.text(0.5, 0.5, msg, ha='center', va='center',
             fontsize=9, color=DARK_GRAY, transform=ax.transAxes)
     return _to_png(fig, dpi)
@@ -142,7 +332,8 @@ def _render_bar(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     ax.invert_yaxis()
     _style_ax(ax, grid='x')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_TICK_IN + _text_in(labels), right=0.15,
+                 bottom=_num_in(0) + 0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -162,14 +353,11 @@ def _render_column(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     bars = ax.bar(x, values, color=colors, width=0.6, zorder=3)
     ax.bar_label(bars, padding=3, fontsize=7, color=DARK_GRAY)
     ax.set_ylim(0, max(values) * 1.28 if values else 1)
-    ax.set_xticks(x)
-    max_len = max((len(l) for l in labels), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax.set_xticklabels(labels, fontsize=8, rotation=rot,
-                        ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax, labels)
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(max(values) * 1.28), bottom=x_in,
+                 title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -179,19 +367,14 @@ def _render_bar_stacked(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if not series:
         return _render_bar(spec, w, h, dpi)
 
-    # Build ordered category and series lists
-    cat_order = list(dict.fromkeys(s.get('label', '') for s in series))
-    ser_names = list(dict.fromkeys(s.get('series', '') for s in series))
-    data_map: dict = {sn: {c: 0.0 for c in cat_order} for sn in ser_names}
-    for item in series:
-        data_map[item.get('series', '')][item.get('label', '')] = float(item.get('value', 0))
+    cat_order, ser_names, mat = _pivot_series(series)
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     y = list(range(len(cat_order)))
     bottoms = np.zeros(len(cat_order))
     for i, sn in enumerate(ser_names):
-        vals = np.array([data_map[sn][c] for c in cat_order])
+        vals = mat[i]
         ax.barh(y, vals, left=bottoms, label=sn,
                 color=MULTI_PAL[i % len(MULTI_PAL)], height=0.6, zorder=3)
         bottoms += vals
@@ -203,7 +386,8 @@ def _render_bar_stacked(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     ncol = min(4, len(ser_names))
     ax.legend(loc='lower right', ncol=ncol, fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_TICK_IN + _text_in(cat_order), right=0.15,
+                 bottom=_num_in(0) + 0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -213,32 +397,25 @@ def _render_column_stacked(spec: ChartSpec, w: float, h: float, dpi: int) -> byt
     if not series:
         return _render_column(spec, w, h, dpi)
 
-    cat_order = list(dict.fromkeys(s.get('label', '') for s in series))
-    ser_names = list(dict.fromkeys(s.get('series', '') for s in series))
-    data_map: dict = {sn: {c: 0.0 for c in cat_order} for sn in ser_names}
-    for item in series:
-        data_map[item.get('series', '')][item.get('label', '')] = float(item.get('value', 0))
+    cat_order, ser_names, mat = _pivot_series(series)
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     x = list(range(len(cat_order)))
     bottoms = np.zeros(len(cat_order))
     for i, sn in enumerate(ser_names):
-        vals = np.array([data_map[sn][c] for c in cat_order])
+        vals = mat[i]
         ax.bar(x, vals, bottom=bottoms, label=sn,
                color=MULTI_PAL[i % len(MULTI_PAL)], width=0.6, zorder=3)
         bottoms += vals
 
-    ax.set_xticks(x)
-    max_len = max((len(c) for c in cat_order), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax.set_xticklabels(cat_order, fontsize=8, rotation=rot,
-                        ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax, cat_order)
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     ncol = min(4, len(ser_names))
     ax.legend(loc='upper right', ncol=ncol, fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(bottoms.max()), bottom=x_in,
+                 title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -251,26 +428,25 @@ def _render_line(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     xs_labels = []
+    y_max = 0.0
     for i, s in enumerate(series):
         pts = s.get('points', [])
         xs_labels = [str(p.get('x', '')) for p in pts]
         ys = [float(p.get('y', 0)) for p in pts]
+        y_max = max([y_max] + ys)
         c = s.get('color') or MULTI_PAL[i % len(MULTI_PAL)]
         ax.plot(range(len(xs_labels)), ys, color=c, linewidth=2,
                 marker='o', markersize=4, label=s.get('name', ''), zorder=3)
 
+    x_in = _num_in(0) + 0.05
     if xs_labels:
-        ax.set_xticks(range(len(xs_labels)))
-        max_len = max((len(x) for x in xs_labels), default=0)
-        rot = 30 if max_len > 4 else 0
-        ax.set_xticklabels(xs_labels, fontsize=7, rotation=rot,
-                            ha='right' if rot else 'center')
+        x_in = _apply_xticks(ax, xs_labels, rot_len=4)
 
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     if len(series) > 1:
         ax.legend(loc='upper left', fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(y_max), bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -283,27 +459,26 @@ def _render_area(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     xs_labels = []
+    y_max = 0.0
     for i, s in enumerate(series):
         pts = s.get('points', [])
         xs_labels = [str(p.get('x', '')) for p in pts]
         ys = [float(p.get('y', 0)) for p in pts]
+        y_max = max([y_max] + ys)
         c = s.get('color') or MULTI_PAL[i % len(MULTI_PAL)]
         ax.plot(range(len(xs_labels)), ys, color=c, linewidth=2,
                 label=s.get('name', ''), zorder=3)
         ax.fill_between(range(len(xs_labels)), ys, alpha=0.2, color=c, zorder=2)
 
+    x_in = _num_in(0) + 0.05
     if xs_labels:
-        ax.set_xticks(range(len(xs_labels)))
-        max_len = max((len(x) for x in xs_labels), default=0)
-        rot = 30 if max_len > 4 else 0
-        ax.set_xticklabels(xs_labels, fontsize=7, rotation=rot,
-                            ha='right' if rot else 'center')
+        x_in = _apply_xticks(ax, xs_labels, rot_len=4)
 
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     if len(series) > 1:
         ax.legend(loc='upper left', fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(y_max), bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -314,7 +489,7 @@ def _render_pie(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
         return _render_placeholder(spec, w, h, dpi)
 
     labels = [dp.label for dp in data]
-    values = [dp.value for dp in data]
+    values = np.fromiter((dp.value for dp in data), dtype=float, count=len(data))
     colors = [
         _hex_to_mpl(dp.color) if dp.color else MULTI_PAL[i % len(MULTI_PAL)]
         for i, dp in enumerate(data)
@@ -324,30 +499,32 @@ def _render_pie(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     ax = fig.add_subplot(111)
 
     if len(data) > 4:
-        wedges, _, autotexts = ax.pie(
+        wedges, _, _ = ax.pie(
             values, colors=colors, autopct='%1.0f%%', pctdistance=0.75,
             startangle=90, counterclock=False,
-            wedgeprops={'edgecolor': 'white', 'linewidth': 1.5}
+            wedgeprops={'edgecolor': 'white', 'linewidth': 1.5},
+            textprops={'fontsize': 7, 'color': 'white'}
         )
-        for at in autotexts:
-            at.set_fontsize(7)
-            at.set_color('white')
         ax.legend(wedges, labels, loc='center left', bbox_to_anchor=(1, 0.5),
                   fontsize=7, frameon=False)
     else:
-        wedges, texts, autotexts = ax.pie(
+        # textprops styles slice labels and percentages at creation; only the
+        # percentages need recolouring since the labels sit outside the wedges
+        wedges, _, autotexts = ax.pie(
             values, labels=labels, colors=colors, autopct='%1.0f%%',
             pctdistance=0.75, startangle=90, counterclock=False,
-            wedgeprops={'edgecolor': 'white', 'linewidth': 1.5}
+            wedgeprops={'edgecolor': 'white', 'linewidth': 1.5},
+            textprops={'fontsize': 7}
         )
-        for t in texts:
-            t.set_fontsize(7)
         for at in autotexts:
-            at.set_fontsize(7)
             at.set_color('white')
 
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    side = 0.1 + _text_in(labels, 7)
+    if len(data) > 4:
+        _set_margins(fig, right=0.3 + side, title=spec.title)
+    else:
+        _set_margins(fig, left=side, right=side, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -358,7 +535,7 @@ def _render_donut(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
         return _render_placeholder(spec, w, h, dpi)
 
     labels = [dp.label for dp in data]
-    values = [dp.value for dp in data]
+    values = np.fromiter((dp.value for dp in data), dtype=float, count=len(data))
     default_pal = HABIT_PAL if len(data) == 4 else MULTI_PAL
     colors = [
         _hex_to_mpl(dp.color) if dp.color else default_pal[i % len(default_pal)]
@@ -367,19 +544,17 @@ def _render_donut(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
-    wedges, _, autotexts = ax.pie(
+    wedges, _, _ = ax.pie(
         values, colors=colors, autopct='%1.0f%%', pctdistance=0.75,
         startangle=90, counterclock=False,
-        wedgeprops={'width': 0.55, 'edgecolor': 'white', 'linewidth': 1.5}
+        wedgeprops={'width': 0.55, 'edgecolor': 'white', 'linewidth': 1.5},
+        textprops={'fontsize': 7, 'color': 'white'}
     )
-    for at in autotexts:
-        at.set_fontsize(7)
-        at.set_color('white')
 
     ax.legend(wedges, labels, loc='center left', bbox_to_anchor=(1, 0.5),
               fontsize=7, frameon=False)
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, right=0.4 + _text_in(labels, 7), title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -389,16 +564,20 @@ def _render_scatter(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if not series:
         return _render_placeholder(spec, w, h, dpi)
 
+    n = len(series)
+    xs = np.fromiter((float(s.get('x', 0)) for s in series), dtype=float, count=n)
+    ys = np.fromiter((float(s.get('y', 0)) for s in series), dtype=float, count=n)
+    hl = np.fromiter((bool(s.get('highlight', False)) for s in series),
+                     dtype=bool, count=n)
+    sizes = np.where(hl, 100, 60)
+    colors = [s.get('color') or (PBI_PINK if is_hl else PBI_PINK_LIGHT)
+              for s, is_hl in zip(series, hl)]
+
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
-    for s in series:
-        x = float(s.get('x', 0))
-        y = float(s.get('y', 0))
-        is_hl = s.get('highlight', False)
-        c = s.get('color') or (PBI_PINK if is_hl else PBI_PINK_LIGHT)
-        sz = 100 if is_hl else 60
-        ax.scatter([x], [y], s=sz, c=c, alpha=0.85,
-                   edgecolors='white', linewidth=1.5, zorder=3)
+    ax.scatter(xs, ys, s=sizes, c=colors, alpha=0.85,
+               edgecolors='white', linewidth=1.5, zorder=3)
+    for s, x, y in zip(series, xs, ys):
         name = s.get('name', '')
         if name:
             ax.annotate(name, (x, y), xytext=(0, 8),
@@ -411,7 +590,9 @@ def _render_scatter(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if spec.y_label:
         ax.set_ylabel(spec.y_label, fontsize=8, color=DARK_GRAY)
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(ys.max()) + (0.2 if spec.y_label else 0),
+                 bottom=_num_in(0) + 0.05 + (0.2 if spec.x_label else 0),
+                 right=0.15, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -421,20 +602,25 @@ def _render_bubble(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if not series:
         return _render_placeholder(spec, w, h, dpi)
 
-    raw_sizes = [float(s.get('size', 5)) for s in series]
-    mn, mx = min(raw_sizes), max(raw_sizes)
+    n = len(series)
+    xs = np.fromiter((float(s.get('x', 0)) for s in series), dtype=float, count=n)
+    ys = np.fromiter((float(s.get('y', 0)) for s in series), dtype=float, count=n)
+    raw = np.fromiter((float(s.get('size', 5)) for s in series), dtype=float, count=n)
+    mn, mx = raw.min(), raw.max()
     rng = mx - mn if mx > mn else 1.0
-    norm_sizes = [100 + (v - mn) / rng * 1100 for v in raw_sizes]
+    sizes = 100 + (raw - mn) / rng * 1100
+    colors = [
+        s.get('color') or (PBI_PINK if s.get('highlight', False)
+                           else MULTI_PAL[i % len(MULTI_PAL)])
+        for i, s in enumerate(series)
+    ]
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
-    for i, (s, sz) in enumerate(zip(series, norm_sizes)):
-        x = float(s.get('x', 0))
-        y = float(s.get('y', 0))
-        is_hl = s.get('highlight', False)
-        c = s.get('color') or (PBI_PINK if is_hl else MULTI_PAL[i % len(MULTI_PAL)])
-        ax.scatter([x], [y], s=sz, c=c, alpha=0.8,
-                   edgecolors='white', linewidth=1.5, zorder=3)
+    # One PathCollection for all bubbles rather than one per point
+    ax.scatter(xs, ys, s=sizes, c=colors, alpha=0.8,
+               edgecolors='white', linewidth=1.5, zorder=3)
+    for s, x, y in zip(series, xs, ys):
         name = s.get('name', '')
         if name:
             ax.annotate(name, (x, y), xytext=(0, 8),
@@ -447,7 +633,9 @@ def _render_bubble(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if spec.y_label:
         ax.set_ylabel(spec.y_label, fontsize=8, color=DARK_GRAY)
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(ys.max()) + (0.2 if spec.y_label else 0),
+                 bottom=_num_in(0) + 0.05 + (0.2 if spec.x_label else 0),
+                 right=0.15, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -463,22 +651,22 @@ def _render_radar(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if N < 3:
         return _render_placeholder(spec, w, h, dpi)
 
-    angles = [2 * math.pi * i / N for i in range(N)]
-    angles_closed = angles + [angles[0]]
+    angles = np.linspace(0, 2 * math.pi, N, endpoint=False)
+    angles_closed = np.append(angles, angles[0])
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111, projection='polar')
 
     for i, s in enumerate(series):
-        pts = s.get('points', [])
-        vals = [float(p.get('y', 0)) for p in pts]
-        if len(vals) < N:
-            vals.extend([0] * (N - len(vals)))
-        vals_closed = vals + [vals[0]]
+        # Missing points pad with 0; extra points beyond N are dropped
+        vals = np.zeros(N + 1)
+        for j, p in enumerate(s.get('points', [])[:N]):
+            vals[j] = float(p.get('y', 0))
+        vals[N] = vals[0]
         c = s.get('color') or MULTI_PAL[i % len(MULTI_PAL)]
-        ax.plot(angles_closed, vals_closed, color=c, linewidth=2,
+        ax.plot(angles_closed, vals, color=c, linewidth=2,
                 label=s.get('name', ''))
-        ax.fill(angles_closed, vals_closed, color=c, alpha=0.15)
+        ax.fill(angles_closed, vals, color=c, alpha=0.15)
 
     ax.set_xticks(angles)
     ax.set_xticklabels(categories, fontsize=7, color=DARK_GRAY)
@@ -487,54 +675,69 @@ def _render_radar(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if len(series) > 1:
         ax.legend(loc='lower right', fontsize=7, frameon=False)
 
-    fig.tight_layout(pad=0.4)
+    # Category labels sit outside the polar circle on every side
+    ring = 0.15 + _text_in(categories, 7)
+    _set_margins(fig, left=ring, right=ring, bottom=0.3, top=0.3 + _TITLE_IN)
     return _to_png(fig, dpi)
 
 
 def _render_kpi(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     """Single KPI card — large bold value, label, optional subtitle."""
+    return _kpi_bytes(spec.value or '', spec.label or '', spec.subtitle or '',
+                      spec.title or '', w, h, dpi)
+
+
+@functools.lru_cache(maxsize=64)
+def _kpi_bytes(value: str, label: str, subtitle: str, title: str,
+               w: float, h: float, dpi: int) -> bytes:
+    """KPI card PNG, memoized — cards often repeat across slides."""
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     ax.set_facecolor('#F8FAFD')
     ax.set_axis_off()
 
-    ax.text(0.5, 0.62, spec.value or '', fontsize=28, fontweight='bold',
+    ax.text(0.5, 0.62, value, fontsize=28, fontweight='bold',
             color=PBI_BLUE, ha='center', va='center', transform=ax.transAxes)
-    ax.text(0.5, 0.38, spec.label or '', fontsize=10,
+    ax.text(0.5, 0.38, label, fontsize=10,
             color=DARK_GRAY, ha='center', va='center', transform=ax.transAxes)
-    if spec.subtitle:
-        ax.text(0.5, 0.22, spec.subtitle, fontsize=8,
+    if subtitle:
+        ax.text(0.5, 0.22, subtitle, fontsize=8,
                 color=MID_GRAY, ha='center', va='center', transform=ax.transAxes)
 
-    ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.3)
+    ax.set_title(title, loc='left', fontsize=9, color=DARK_GRAY, pad=4)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=title)
     return _to_png(fig, dpi)
 
 
+@functools.lru_cache(maxsize=16)
+def _kpi_row_layout(n: int):
+    """Tile geometry (x0, width, centre) and font sizes for an n-tile row."""
+    tile_w = 1.0 / n
+    gap = 0.01
+    tiles = tuple(
+        (i * tile_w + gap / 2, tile_w - gap, i * tile_w + gap / 2 + (tile_w - gap) / 2)
+        for i in range(n)
+    )
+    fonts = (max(10, min(22, int(22 / math.sqrt(n)))),
+             max(7,  min(10, int(10 / math.sqrt(n)))),
+             max(6,  min(8,  int(8  / math.sqrt(n)))))
+    return tiles, fonts
+
+
 def _render_kpi_row(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     """Horizontal row of 2-4 compact KPI tiles."""
     kpis = spec.series or []
     if not kpis:
         return _render_kpi(spec, w, h, dpi)
 
-    n = len(kpis)
+    tiles, (val_fs, lbl_fs, sub_fs) = _kpi_row_layout(len(kpis))
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     ax.set_axis_off()
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
 
-    tile_w = 1.0 / n
-    gap = 0.01
-    val_fs  = max(10, min(22, int(22 / math.sqrt(n))))
-    lbl_fs  = max(7,  min(10, int(10 / math.sqrt(n))))
-    sub_fs  = max(6,  min(8,  int(8  / math.sqrt(n))))
-
-    for i, kpi in enumerate(kpis):
-        x0 = i * tile_w + gap / 2
-        tw = tile_w - gap
-        cx = x0 + tw / 2
-
+    for kpi, (x0, tw, cx) in zip(kpis, tiles):
         # Tile background
         rect = mpatches.FancyBboxPatch(
             (x0, 0.05), tw, 0.90,
@@ -557,7 +760,7 @@ def _render_kpi_row(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
                     transform=ax.transAxes)
 
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.3)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -577,17 +780,18 @@ def _render_heatmap(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
         dtype=float
     )
 
+    norm_max = data.max() if data.max() > 0 else 1.0
+
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
-    im = ax.imshow(data, cmap='Blues', aspect='auto',
-                   vmin=0, vmax=data.max() if data.max() > 0 else 1)
+    ax.imshow(data, cmap=HEATMAP_CMAP, norm=Normalize(vmin=0, vmax=norm_max),
+              aspect='auto', interpolation='nearest')
 
     ax.set_xticks(range(len(cols)))
     ax.set_xticklabels(cols, fontsize=7, rotation=30, ha='right')
     ax.set_yticks(range(len(rows)))
     ax.set_yticklabels(rows, fontsize=7)
 
-    norm_max = data.max() if data.max() > 0 else 1.0
     cell_fs = max(6, min(9, int(70 / max(len(rows), len(cols)))))
     fmt = spec.value_format or '.1f'
     for ri in range(len(rows)):
@@ -605,7 +809,9 @@ def _render_heatmap(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     for sp in ax.spines.values():
         sp.set_visible(False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_TICK_IN + _text_in(rows, 7),
+                 bottom=_TICK_IN + 0.5 * _text_in(cols, 7) + 0.1,
+                 title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -656,7 +862,7 @@ def _render_table(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
                 cell.get_text().set_color(DARK_GRAY)
 
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.3)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -708,7 +914,7 @@ def _render_funnel(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
                 color=DARK_GRAY, transform=ax.transAxes)
 
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.3)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -817,15 +1023,15 @@ def _render_treemap(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
                     ha='left', transform=ax.transAxes, clip_on=True)
 
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.3)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
 def _render_gauge(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     """
     Half-donut gauge chart.
-    With startangle=180 and counterclock=False, the filled+empty arcs
-    occupy the top semicircle; the hidden (white) slice sits below.
+    The filled arc runs clockwise from the left over the top semicircle,
+    followed by the empty arc; the value and label sit below the centre.
     """
     try:
         raw = float(spec.value or 0)
@@ -833,22 +1039,26 @@ def _render_gauge(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
         raw = 0.0
     max_val = spec.max_value or 100.0
     frac = max(0.0, min(1.0, raw / max_val))
-    filled = frac * 50.0
-    empty  = (1 - frac) * 50.0
-    hidden = 50.0
+    split = 180.0 - 180.0 * frac
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
 
-    ax.pie(
-        [filled, empty, hidden],
-        colors=[PBI_BLUE, LIGHT_GRAY, 'white'],
-        startangle=180, counterclock=False,
-        wedgeprops={'width': 0.45, 'edgecolor': 'white', 'linewidth': 1.5}
-    )
-
-    # Show top half only; leave room below for text
-    ax.set_ylim(-0.40, 1)
+    # Filled and empty arcs over the top semicircle, placed directly as
+    # wedges. The white lower half ax.pie needed is invisible on the white
+    # background, so it isn't drawn; everything stays inside the axes.
+    ax.set_aspect('equal')
+    ax.set(frame_on=False, xticks=[], yticks=[], xlim=(-1.25, 1.25))
+    for theta1, theta2, color in ((split, 180.0, PBI_BLUE),
+                                  (0.0, split, LIGHT_GRAY)):
+        ax.add_patch(mpatches.Wedge((0, 0), 1, theta1, theta2, width=0.45,
+                                    facecolor=color, edgecolor='white',
+                                    linewidth=1.5))
+
+    # Arcs over the top half, value and label below the centre. The lower
+    # half stays inside the axes as blank space (where ax.pie's hidden slice
+    # sat) so the image keeps the proportions of the box it's placed in.
+    ax.set_ylim(-1, 1)
 
     # Value text just below center
     val_txt = f"{int(round(raw))}{'%' if max_val == 100 else ''}"
@@ -861,7 +1071,7 @@ def _render_gauge(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if spec.title:
         ax.set_title(spec.title, loc='left', fontsize=9, color=DARK_GRAY, pad=4)
 
-    fig.tight_layout(pad=0.3)
+    _set_margins(fig, left=0.05, right=0.05, bottom=0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -952,15 +1162,12 @@ def _render_waterfall(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
         ax.plot([i + 0.3, i + 0.7], [y_conn, y_conn],
                 color=LIGHT_GRAY, linewidth=0.8, zorder=2)
 
-    ax.set_xticks(x)
-    max_len = max((len(l) for l in labels), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax.set_xticklabels(labels, fontsize=8, rotation=rot,
-                        ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax, labels)
     _style_ax(ax, grid='y')
     ax.axhline(0, color=LIGHT_GRAY, linewidth=0.8, zorder=1)
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(max(b + v for b, v in zip(bottoms, bar_values))),
+                 bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -999,6 +1206,7 @@ def _render_combo(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
 
     # Line overlay on secondary axis
     ax2 = ax1.twinx()
+    ax2.spines['right'].set_visible(True)
     for i, s in enumerate(spec.series):
         pts = s.get('points', [])
         line_xs = []
@@ -1034,11 +1242,7 @@ def _render_combo(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if spec.x_label:
         ax2.set_ylabel(spec.x_label, fontsize=8, color=DARK_GRAY)  # x_label used for right-axis label
 
-    ax1.set_xticks(x)
-    max_len = max((len(l) for l in labels), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax1.set_xticklabels(labels, fontsize=8, rotation=rot,
-                         ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax1, labels)
     _style_ax(ax1, grid='y')
 
     # Combined legend
@@ -1049,7 +1253,9 @@ def _render_combo(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
                    loc='upper left', fontsize=7, frameon=False)
 
     ax1.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(max(values) * 1.25) + (0.2 if spec.y_label else 0),
+                 right=_num_in(ax2.get_ylim()[1]) + (0.2 if spec.x_label else 0),
+                 bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -1063,23 +1269,18 @@ def _render_bar_stacked_100(spec: ChartSpec, w: float, h: float, dpi: int) -> by
     if not series:
         return _render_bar(spec, w, h, dpi)
 
-    cat_order = list(dict.fromkeys(s.get('label', '') for s in series))
-    ser_names = list(dict.fromkeys(s.get('series', '') for s in series))
-    data_map: dict = {sn: {c: 0.0 for c in cat_order} for sn in ser_names}
-    for item in series:
-        data_map[item.get('series', '')][item.get('label', '')] = float(item.get('value', 0))
+    cat_order, ser_names, mat = _pivot_series(series)
 
-    # Compute totals for normalization
-    totals = {c: sum(data_map[sn][c] for sn in ser_names) for c in cat_order}
+    # Normalize each category column to 100%
+    totals = mat.sum(axis=0)
+    pct = mat / np.where(totals > 0, totals, 1.0) * 100.0
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     y = list(range(len(cat_order)))
     bottoms = np.zeros(len(cat_order))
     for i, sn in enumerate(ser_names):
-        vals_raw = np.array([data_map[sn][c] for c in cat_order])
-        tots = np.array([totals[c] if totals[c] > 0 else 1.0 for c in cat_order])
-        vals = vals_raw / tots * 100.0
+        vals = pct[i]
         ax.barh(y, vals, left=bottoms, label=sn,
                 color=MULTI_PAL[i % len(MULTI_PAL)], height=0.6, zorder=3)
         # Center-label percentages ≥ 8%
@@ -1098,7 +1299,8 @@ def _render_bar_stacked_100(spec: ChartSpec, w: float, h: float, dpi: int) -> by
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     ncol = min(4, len(ser_names))
     ax.legend(loc='lower right', ncol=ncol, fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_TICK_IN + _text_in(cat_order), right=0.15,
+                 bottom=_num_in(0) + 0.05, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -1108,22 +1310,17 @@ def _render_column_stacked_100(spec: ChartSpec, w: float, h: float, dpi: int) ->
     if not series:
         return _render_column(spec, w, h, dpi)
 
-    cat_order = list(dict.fromkeys(s.get('label', '') for s in series))
-    ser_names = list(dict.fromkeys(s.get('series', '') for s in series))
-    data_map: dict = {sn: {c: 0.0 for c in cat_order} for sn in ser_names}
-    for item in series:
-        data_map[item.get('series', '')][item.get('label', '')] = float(item.get('value', 0))
+    cat_order, ser_names, mat = _pivot_series(series)
 
-    totals = {c: sum(data_map[sn][c] for sn in ser_names) for c in cat_order}
+    totals = mat.sum(axis=0)
+    pct = mat / np.where(totals > 0, totals, 1.0) * 100.0
 
     fig = _get_fig(w, h)
     ax = fig.add_subplot(111)
     x = list(range(len(cat_order)))
     bottoms = np.zeros(len(cat_order))
     for i, sn in enumerate(ser_names):
-        vals_raw = np.array([data_map[sn][c] for c in cat_order])
-        tots = np.array([totals[c] if totals[c] > 0 else 1.0 for c in cat_order])
-        vals = vals_raw / tots * 100.0
+        vals = pct[i]
         ax.bar(x, vals, bottom=bottoms, label=sn,
                color=MULTI_PAL[i % len(MULTI_PAL)], width=0.6, zorder=3)
         for j, v in enumerate(vals):
@@ -1134,16 +1331,12 @@ def _render_column_stacked_100(spec: ChartSpec, w: float, h: float, dpi: int) ->
         bottoms += vals
 
     ax.set_ylim(0, 100)
-    ax.set_xticks(x)
-    max_len = max((len(c) for c in cat_order), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax.set_xticklabels(cat_order, fontsize=8, rotation=rot,
-                        ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax, cat_order)
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     ncol = min(4, len(ser_names))
     ax.legend(loc='upper right', ncol=ncol, fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(100), bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -1161,12 +1354,7 @@ def _render_ribbon(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
     if not series_raw:
         return _render_placeholder(spec, w, h, dpi)
 
-    # Parse into categories and series
-    cat_order = list(dict.fromkeys(s.get('label', '') for s in series_raw))
-    ser_names = list(dict.fromkeys(s.get('series', '') for s in series_raw))
-    data_map: dict = {sn: {c: 0.0 for c in cat_order} for sn in ser_names}
-    for item in series_raw:
-        data_map[item.get('series', '')][item.get('label', '')] = float(item.get('value', 0))
+    cat_order, ser_names, mat = _pivot_series(series_raw)
 
     n_cats = len(cat_order)
     if n_cats < 2:
@@ -1178,37 +1366,26 @@ def _render_ribbon(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
 
     # At each x-tick, sort series by value (descending) and stack bottom-up
     # This makes the "ribbons" cross when ranks change
-    bottoms = np.zeros(n_cats)
-    drawn = {sn: {'y0': np.zeros(n_cats), 'y1': np.zeros(n_cats)} for sn in ser_names}
-
+    y0 = np.zeros_like(mat)
     for ci in range(n_cats):
-        cat = cat_order[ci]
-        ranked = sorted(ser_names, key=lambda sn: data_map[sn][cat], reverse=True)
-        b = 0.0
-        for sn in ranked:
-            val = data_map[sn][cat]
-            drawn[sn]['y0'][ci] = b
-            drawn[sn]['y1'][ci] = b + val
-            b += val
+        ranked = np.argsort(-mat[:, ci], kind='stable')
+        y0[ranked, ci] = np.concatenate(([0.0], np.cumsum(mat[ranked, ci])[:-1]))
+    y1 = y0 + mat
 
     for i, sn in enumerate(ser_names):
         c = MULTI_PAL[i % len(MULTI_PAL)]
-        ax.fill_between(x, drawn[sn]['y0'], drawn[sn]['y1'],
+        ax.fill_between(x, y0[i], y1[i],
                         color=c, alpha=0.7, label=sn, zorder=3)
         # Mid-line for visual clarity
-        mid = (drawn[sn]['y0'] + drawn[sn]['y1']) / 2
+        mid = (y0[i] + y1[i]) / 2
         ax.plot(x, mid, color=c, linewidth=1.0, alpha=0.5, zorder=4)
 
-    ax.set_xticks(x)
-    max_len = max((len(c) for c in cat_order), default=0)
-    rot = 30 if max_len > 6 else 0
-    ax.set_xticklabels(cat_order, fontsize=8, rotation=rot,
-                        ha='right' if rot else 'center')
+    x_in = _apply_xticks(ax, cat_order)
     _style_ax(ax, grid='y')
     ax.set_title(spec.title or '', loc='left', fontsize=9, color=DARK_GRAY, pad=4)
     ncol = min(4, len(ser_names))
     ax.legend(loc='upper right', ncol=ncol, fontsize=7, frameon=False)
-    fig.tight_layout(pad=0.4)
+    _set_margins(fig, left=_num_in(y1.max()), bottom=x_in, title=spec.title)
     return _to_png(fig, dpi)
 
 
@@ -1216,42 +1393,84 @@ def _render_ribbon(spec: ChartSpec, w: float, h: float, dpi: int) -> bytes:
 # Dispatcher
 # ---------------------------------------------------------------------------
 
-_DISPATCH = {
-    'bar':               _render_bar,
-    'bar_stacked':       _render_bar_stacked,
-    'bar_stacked_100':   _render_bar_stacked_100,
-    'column':            _render_column,
-    'column_stacked':    _render_column_stacked,
-    'column_stacked_100':_render_column_stacked_100,
-    'line':              _render_line,
-    'area':              _render_area,
-    'pie':               _render_pie,
-    'donut':             _render_donut,
-    'scatter':           _render_scatter,
-    'bubble':            _render_bubble,
-    'radar':             _render_radar,
-    'kpi':               _render_kpi,
-    'kpi_row':           _render_kpi_row,
-    'heatmap':           _render_heatmap,
-    'table':             _render_table,
-    'funnel':            _render_funnel,
-    'treemap':           _render_treemap,
-    'gauge':             _render_gauge,
-    'waterfall':         _render_waterfall,
-    'combo':             _render_combo,
-    'column_line':       _render_combo,        # alias
-    'ribbon':            _render_ribbon,
-    # PBI-native name aliases
-    'card':              _render_kpi,
-    'multi_row_card':    _render_kpi_row,
+_RENDERERS = {
+    ChartKind.BAR:                _render_bar,
+    ChartKind.BAR_STACKED:        _render_bar_stacked,
+    ChartKind.BAR_STACKED_100:    _render_bar_stacked_100,
+    ChartKind.COLUMN:             _render_column,
+    ChartKind.COLUMN_STACKED:     _render_column_stacked,
+    ChartKind.COLUMN_STACKED_100: _render_column_stacked_100,
+    ChartKind.LINE:               _render_line,
+    ChartKind.AREA:               _render_area,
+    ChartKind.PIE:                _render_pie,
+    ChartKind.DONUT:              _render_donut,
+    ChartKind.SCATTER:            _render_scatter,
+    ChartKind.BUBBLE:             _render_bubble,
+    ChartKind.RADAR:              _render_radar,
+    ChartKind.KPI:                _render_kpi,       # also 'card'
+    ChartKind.KPI_ROW:            _render_kpi_row,   # also 'multi_row_card'
+    ChartKind.HEATMAP:            _render_heatmap,
+    ChartKind.TABLE:              _render_table,
+    ChartKind.FUNNEL:             _render_funnel,
+    ChartKind.TREEMAP:            _render_treemap,
+    ChartKind.GAUGE:              _render_gauge,
+    ChartKind.WATERFALL:          _render_waterfall,
+    ChartKind.COMBO:              _render_combo,     # also 'column_line'
+    ChartKind.RIBBON:             _render_ribbon,
 }
 
+# Indexed by ChartKind value; UNKNOWN maps to None (placeholder)
+_DISPATCH = tuple(_RENDERERS.get(k) for k in ChartKind)
+
+# Renderers drawn under _PBI_AXES_RC
+_PBI_AXES_RENDERERS = frozenset({
+    _render_bar, _render_bar_stacked, _render_bar_stacked_100,
+    _render_column, _render_column_stacked, _render_column_stacked_100,
+    _render_line, _render_area, _render_scatter, _render_bubble,
+    _render_waterfall, _render_combo, _render_ribbon,
+})
+
+
+# Rendered PNGs keyed by (spec digest, size, dpi). Specs are plain value
+# objects, so identical specs always render identical bytes.
+_PNG_CACHE: OrderedDict = OrderedDict()
+_PNG_CACHE_MAX = 512
+_PNG_CACHE_LOCK = threading.Lock()
+
+# Each worker process pays for a fresh interpreter and matplotlib import
+# (over a second under spawn, the Windows default) before its first chart,
+# while a chart renders in well under 0.1s. Batches smaller than this render
+# serially, and each worker is given at least CHARTS_PER_WORKER charts.
+PARALLEL_MIN_CHARTS = 32
+CHARTS_PER_WORKER = 16
+
+
+def _cache_key(blob: bytes, width_in: float, height_in: float, dpi: int):
+    return (hashlib.blake2b(blob, digest_size=16).digest(), width_in, height_in, dpi)
+
+
+def _cache_get(key):
+    with _PNG_CACHE_LOCK:
+        png = _PNG_CACHE.get(key)
+        if png is not None:
+            _PNG_CACHE.move_to_end(key)
+        return png
+
+
+def _cache_put(key, png: bytes):
+    with _PNG_CACHE_LOCK:
+        _PNG_CACHE[key] = png
+        if len(_PNG_CACHE) > _PNG_CACHE_MAX:
+            _PNG_CACHE.popitem(last=False)
+
 
 def render_chart_to_png(spec: ChartSpec, width_in: float, height_in: float,
                          dpi: int = 200) -> bytes:
     """
     Render a ChartSpec as PNG bytes at the requested size.
 
+    Repeat calls with an equal spec, size and dpi return the cached bytes.
+
     Args:
         spec:       ChartSpec dataclass with chart type and data
         width_in:   Chart width  in inches (caller converts from EMU: emu / 914400)
@@ -1262,10 +1481,94 @@ def render_chart_to_png(spec: ChartSpec, width_in: float, height_in: float,
         PNG image as raw bytes, ready for:
             slide.shapes.add_picture(io.BytesIO(png), left, top, width, height)
     """
-    fn = _DISPATCH.get((spec.type or '').lower().strip())
+    key = _cache_key(pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL),
+                     width_in, height_in, dpi)
+    png = _cache_get(key)
+    if png is None:
+        png = _render_chart(spec, width_in, height_in, dpi)
+        _cache_put(key, png)
+    return png
+
+
+def _init_worker():
+    # Build the thread-local figure up front so the first chart in each
+    # worker doesn't pay for it
+    _get_fig(1.0, 1.0)
+
+
+def _render_blob(blob: bytes, width_in: float, height_in: float, dpi: int) -> bytes:
+    return _render_chart(pickle.loads(blob), width_in, height_in, dpi)
+
+
+def render_charts_to_png(jobs, dpi: int = 200, max_workers: int = None) -> list:
+    """
+    Render many charts at once across a process pool.
+
+    Each chart is independent and CPU-bound in Agg, so separate processes
+    scale where threads would not. Batches below PARALLEL_MIN_CHARTS
+    uncached charts render serially, since worker start-up would cost more
+    than it saves. Results go through the same cache as
+    render_chart_to_png, so a later single call for any of these specs is
+    a cache hit.
+
+    Args:
+        jobs:        Iterable of (spec, width_in, height_in) tuples
+        dpi:         Output resolution (default 200 DPI)
+        max_workers: Pool size (default: os.cpu_count(), capped so each
+                     worker gets CHARTS_PER_WORKER charts)
+
+    Returns:
+        PNG bytes for each job, in input order.
+    """
+    keys = []
+    done = {}      # cache key -> png
+    pending = {}   # cache key -> (blob, w, h), deduplicated
+    for spec, w, h in jobs:
+        blob = pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+        key = _cache_key(blob, w, h, dpi)
+        keys.append(key)
+        if key in done or key in pending:
+            continue
+        png = _cache_get(key)
+        if png is not None:
+            done[key] = png
+        else:
+            pending[key] = (blob, w, h)
+
+    results = {}
+    workers = min(max_workers or os.cpu_count() or 1,
+                  len(pending) // CHARTS_PER_WORKER)
+    if workers > 1 and len(pending) >= PARALLEL_MIN_CHARTS:
+        from concurrent.futures import ProcessPoolExecutor
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker) as pool:
+                futures = {key: pool.submit(_render_blob, blob, w, h, dpi)
+                           for key, (blob, w, h) in pending.items()}
+                results = {key: f.result() for key, f in futures.items()}
+        except Exception as e:
+            print(f"  WARNING: parallel chart render failed, rendering serially: {e}")
+            results = {}
+    for key, (blob, w, h) in pending.items():
+        png = results.get(key)
+        if png is None:
+            png = _render_blob(blob, w, h, dpi)
+        _cache_put(key, png)
+        done[key] = png
+
+    return [done[key] for key in keys]
+
+
+def _render_chart(spec: ChartSpec, width_in: float, height_in: float,
+                  dpi: int) -> bytes:
+    """Dispatch to the per-type renderer, falling back to a placeholder."""
+    fn = _DISPATCH[spec.kind]
     if fn is None:
         return _render_placeholder(spec, width_in, height_in, dpi)
     try:
+        if fn in _PBI_AXES_RENDERERS:
+            with matplotlib.rc_context(_PBI_AXES_RC):
+                return fn(spec, width_in, height_in, dpi)
         return fn(spec, width_in, height_in, dpi)
     except Exception as e:
         print(f"  WARNING: mpl chart render failed ({spec.type}): {e}")
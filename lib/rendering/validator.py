@@ -7,10 +7,15 @@ Validates output against Claude PowerPoint Constitution v1.7.
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from lib.analysis.insights import Insight
+import os
 import re
 
+# Below this many slides a process pool costs more to start than the
+# checks themselves, so validate_deck stays serial
+PARALLEL_MIN_SLIDES = 64
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of validation check"""
     passed: bool
@@ -38,6 +43,46 @@ class ConstitutionValidator:
         'opportunity', 'gap', 'validates', 'targeting'
     ]
 
+    # Precompiled once per class; action words keep substring semantics.
+    _GENERIC_RES = tuple(re.compile(p) for p in GENERIC_PATTERNS)
+    _ACTION_RE = re.compile('|'.join(re.escape(w) for w in ACTION_WORDS))
+    _DIGIT_RE = re.compile(r'\d')
+    # Literal lead-in of each generic pattern; text without it can't match,
+    # so a pattern's regex only runs once a cheap substring test hits.
+    _GENERIC_PREFIXES = tuple(re.split(r'[\\\[(.*+?{|^$]', p, maxsplit=1)[0]
+                              for p in GENERIC_PATTERNS)
+
+    # Results whose text never varies are built once and shared across slides
+    # (ValidationResult is frozen, so sharing is safe)
+    _ACTIONABLE_MISSING = ValidationResult(
+        passed=False,
+        rule="Section 5: Actionability",
+        message=f"Insights lack actionable language (requires/indicates/action/etc.)",
+        severity="warning"
+    )
+    _ACTIONABLE_OK = ValidationResult(
+        passed=True,
+        rule="Section 5: Actionability",
+        message="Insights contain actionable language",
+        severity="info"
+    )
+    _SOURCE_NUMBERS_MISSING = ValidationResult(
+        passed=False,
+        rule="Section 6.3: Source traceability",
+        message="No source numbers tracked",
+        severity="warning"
+    )
+
+    def _generic_match(self, text_lower: str):
+        """Return the first GENERIC_PATTERNS entry (in list order) found in
+        lowercased text, or None."""
+        for pattern, prefix, regex in zip(self.GENERIC_PATTERNS,
+                                          self._GENERIC_PREFIXES,
+                                          self._GENERIC_RES):
+            if prefix in text_lower and regex.search(text_lower):
+                return pattern
+        return None
+
     def validate_insights(self, insights: Dict[str, Insight]) -> List[ValidationResult]:
         """
         Validate all insights against Constitution.
@@ -50,6 +95,47 @@ class ConstitutionValidator:
         """
         results = []
 
+        for title, insight in self._slides(insights):
+            results.extend(self._validate_slide(title, insight))
+
+        return results
+
+    def validate_deck(self, insights: Dict[str, Insight],
+                      max_workers: int = None) -> List[ValidationResult]:
+        """
+        Validate all insights, spreading slides across a process pool.
+
+        Per-slide checks are independent and CPU-bound, so large decks are
+        validated in parallel; small ones run serially. Results come back in
+        the same order as validate_insights.
+
+        Args:
+            insights:    Dictionary of slide titles to Insights
+            max_workers: Pool size (default: os.cpu_count())
+
+        Returns:
+            List of validation results
+        """
+        slides = list(self._slides(insights))
+        workers = min(max_workers or os.cpu_count() or 1, len(slides))
+        if workers > 1 and len(slides) >= PARALLEL_MIN_SLIDES:
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    per_slide = list(pool.map(self._validate_item, slides,
+                                              chunksize=8))
+                return [r for slide_results in per_slide for r in slide_results]
+            except Exception as e:
+                print(f"  WARNING: parallel validation failed, validating serially: {e}")
+
+        results = []
+        for item in slides:
+            results.extend(self._validate_item(item))
+        return results
+
+    @staticmethod
+    def _slides(insights: Dict[str, Insight]):
+        """Yield the (title, insight) pairs that are real slides"""
         for title, insight in insights.items():
             # Skip special keys used for executive summary and recommendations
             # Handle both string keys and integer keys (slide numbers)
@@ -60,23 +146,38 @@ class ConstitutionValidator:
             if isinstance(title, int):
                 continue
 
-            # Section 4: Insight-driven headlines
-            results.extend(self._validate_headline(title, insight.headline))
+            yield title, insight
+
+    def _validate_item(self, item: Tuple[str, Insight]) -> List[ValidationResult]:
+        """Pool entry point: validate one (title, insight) pair"""
+        return self._validate_slide(*item)
 
-            # Section 5: Actionability
-            results.extend(self._validate_actionability(title, insight.bullet_points))
+    def _validate_slide(self, slide_title: str, insight: Insight) -> List[ValidationResult]:
+        """Run every per-slide check in one pass, lowercasing each text once"""
+        headline = insight.headline
+        bullet_texts = [
+            b.text if hasattr(b, 'text') else str(b) for b in insight.bullet_points
+        ]
+        bullets_lower = [t.lower() for t in bullet_texts]
 
-            # Section 6.3: Specific numbers from source
-            results.extend(self._validate_numbers(title, insight))
+        # Section 4: Insight-driven headlines
+        results = self._validate_headline(slide_title, headline, headline.lower())
+
+        # Section 5: Actionability
+        results.extend(self._validate_actionability(slide_title, bullet_texts, bullets_lower))
+
+        # Section 6.3: Specific numbers from source
+        results.extend(self._validate_numbers(slide_title, insight))
 
         return results
 
-    def _validate_headline(self, slide_title: str, headline: str) -> List[ValidationResult]:
+    def _validate_headline(self, slide_title: str, headline: str,
+                           headline_lower: str) -> List[ValidationResult]:
         """Validate headline is insight-driven with specific numbers"""
         results = []
 
         # Check for numbers in headline
-        has_number = bool(re.search(r'\d+', headline))
+        has_number = self._DIGIT_RE.search(headline) is not None
 
         if not has_number:
             results.append(ValidationResult(
@@ -94,56 +195,35 @@ class ConstitutionValidator:
             ))
 
         # Check headline is not generic
-        for pattern in self.GENERIC_PATTERNS:
-            if re.search(pattern, headline.lower()):
-                results.append(ValidationResult(
-                    passed=False,
-                    rule="Section 5: Actionability (no generic statements)",
-                    message=f"Headline contains generic pattern: {pattern}",
-                    severity="error"
-                ))
-                break
+        pattern = self._generic_match(headline_lower)
+        if pattern:
+            results.append(ValidationResult(
+                passed=False,
+                rule="Section 5: Actionability (no generic statements)",
+                message=f"Headline contains generic pattern: {pattern}",
+                severity="error"
+            ))
 
         return results
 
-    def _validate_actionability(self, slide_title: str, bullets) -> List[ValidationResult]:
+    def _validate_actionability(self, slide_title: str, bullet_texts: List[str],
+                                bullets_lower: List[str]) -> List[ValidationResult]:
         """Validate insights are actionable, not just data restatements"""
-        results = []
-
-        combined_text = ' '.join(
-            b.text if hasattr(b, 'text') else str(b) for b in bullets
-        ).lower()
+        # Check for action words, stopping at the first bullet that has one
+        search = self._ACTION_RE.search
+        has_action = any(search(b) for b in bullets_lower)
 
-        # Check for action words
-        has_action = any(word in combined_text for word in self.ACTION_WORDS)
-
-        if not has_action:
-            results.append(ValidationResult(
-                passed=False,
-                rule="Section 5: Actionability",
-                message=f"Insights lack actionable language (requires/indicates/action/etc.)",
-                severity="warning"
-            ))
-        else:
-            results.append(ValidationResult(
-                passed=True,
-                rule="Section 5: Actionability",
-                message="Insights contain actionable language",
-                severity="info"
-            ))
+        results = [self._ACTIONABLE_OK if has_action else self._ACTIONABLE_MISSING]
 
         # Check for generic statements
-        for bullet in bullets:
-            bullet_text = bullet.text if hasattr(bullet, 'text') else str(bullet)
-            for pattern in self.GENERIC_PATTERNS:
-                if re.search(pattern, bullet_text.lower()):
-                    results.append(ValidationResult(
-                        passed=False,
-                        rule="Section 5: No generic statements",
-                        message=f"Bullet contains generic statement: {bullet_text[:50]}...",
-                        severity="error"
-                    ))
-                    break
+        for bullet_text, bullet_lower in zip(bullet_texts, bullets_lower):
+            if self._generic_match(bullet_lower):
+                results.append(ValidationResult(
+                    passed=False,
+                    rule="Section 5: No generic statements",
+                    message=f"Bullet contains generic statement: {bullet_text[:50]}...",
+                    severity="error"
+                ))
 
         return results
 
@@ -156,16 +236,11 @@ class ConstitutionValidator:
             results.append(ValidationResult(
                 passed=True,
                 rule="Section 6.3: Source traceability",
-                message=f"Numbers tracked: {', '.join(insight.source_numbers)}",
+                message=f"Numbers tracked: {', '.join(dict.fromkeys(insight.source_numbers))}",
                 severity="info"
             ))
         else:
-            results.append(ValidationResult(
-                passed=False,
-                rule="Section 6.3: Source traceability",
-                message="No source numbers tracked",
-                severity="warning"
-            ))
+            results.append(self._SOURCE_NUMBERS_MISSING)
 
         return results
 
@@ -195,9 +270,15 @@ class ConstitutionValidator:
 
     def generate_report(self, results: List[ValidationResult]) -> str:
         """Generate validation report"""
-        errors = [r for r in results if r.severity == "error"]
-        warnings = [r for r in results if r.severity == "warning"]
-        passed = [r for r in results if r.passed and r.severity == "info"]
+        errors, warnings, passed = [], [], []
+        for r in results:
+            severity = r.severity
+            if severity == "error":
+                errors.append(r)
+            elif severity == "warning":
+                warnings.append(r)
+            elif r.passed and severity == "info":
+                passed.append(r)
 
         report = []
         report.append("=" * 60)
@@ -243,7 +324,7 @@ def validate_output(insights: Dict[str, Insight]) -> Tuple[bool, str]:
         Tuple of (passed, report)
     """
     validator = ConstitutionValidator()
-    results = validator.validate_insights(insights)
+    results = validator.validate_deck(insights)
     report = validator.generate_report(results)
 
     # Check if any errors
@@ -17,15 +17,22 @@ Usage:
     python setup_pbi_mcp.py           # auto-detect, install, configure
     python setup_pbi_mcp.py --check   # status check only (no install)
     python setup_pbi_mcp.py --force   # reinstall even if already configured
+    python setup_pbi_mcp.py --keep-vsix   # also keep the downloaded VSIX in temp/
 """
 
 import argparse
+import io
 import json
 import os
+import shutil
 import sys
+import threading
+import time
 import zipfile
 from pathlib import Path
 
+from lib import json_io
+
 # ─── Constants ────────────────────────────────────────────────────────────────
 MCP_PUBLISHER = "analysis-services"
 MCP_EXTENSION = "powerbi-modeling-mcp"
@@ -33,13 +40,19 @@ MCP_NAME      = "powerbi-modeling"          # key used inside .mcp.json
 MCP_EXE       = "powerbi-modeling-mcp.exe"
 MANUAL_DIR    = Path(r"C:\MCPServers\PowerBIModelingMCP")
 MCP_JSON      = Path(".mcp.json")
+VERSION_CACHE = Path.home() / ".cache" / "pbi_mcp_version.json"
+VERSION_TTL   = 6 * 3600                    # seconds
+
+# VSIX packaging metadata — not needed to run the server
+_VSIX_SKIP    = {"[Content_Types].xml", "extension.vsixmanifest"}
+_COPY_BUF     = 1 << 20
 
 
 # ─── Pretty printing ──────────────────────────────────────────────────────────
+_BANNER_BAR = "=" * 68
+
 def _banner(text):
-    print("\n" + "=" * 68)
-    print(f"  {text}")
-    print("=" * 68)
+    print(f"\n{_BANNER_BAR}\n  {text}\n{_BANNER_BAR}")
 
 def _step(label):  print(f"\n  {label}")
 def _ok(msg):      print(f"    OK  {msg}")
@@ -50,41 +63,85 @@ def _fail(msg):    print(f"    XX  {msg}")
 # ─── 1. Detection ─────────────────────────────────────────────────────────────
 def find_installed_exe() -> "Path | None":
     """Scan known locations for an already-installed MCP executable."""
-    candidates = []
+    # a) Manual install directory — a single stat, and the usual hit once
+    #    this script has installed the server
+    manual = MANUAL_DIR / "extension" / "server" / MCP_EXE
+    if manual.is_file():
+        return Path(os.path.abspath(manual))
 
-    # a) VS Code extension folder  (~/.vscode/extensions/<publisher>.<ext>-<ver>/)
+    # b) VS Code extension folder  (~/.vscode/extensions/<publisher>.<ext>-<ver>/)
+    candidates = []
     vscode_ext = Path(os.environ.get("USERPROFILE", Path.home())) / ".vscode" / "extensions"
-    if vscode_ext.exists():
-        for d in vscode_ext.glob(f"{MCP_PUBLISHER}.{MCP_EXTENSION}-*"):
-            candidates.append(d / "extension" / "server" / MCP_EXE)
-
-    # b) Manual install directory
-    candidates.append(MANUAL_DIR / "extension" / "server" / MCP_EXE)
+    prefix = f"{MCP_PUBLISHER}.{MCP_EXTENSION}-"
+    try:
+        with os.scandir(vscode_ext) as it:
+            for e in it:
+                if e.name.startswith(prefix) and e.is_dir():
+                    candidates.append(os.path.join(e.path, "extension", "server", MCP_EXE))
+    except OSError:
+        pass
 
     for c in candidates:
-        if c.exists():
-            return c.resolve()
+        if os.path.isfile(c):
+            return Path(os.path.abspath(c))
     return None
 
 
-def read_mcp_json_config() -> "tuple[bool, Path | None]":
-    """Return (is_configured, verified_exe_path_or_None) from .mcp.json."""
-    if not MCP_JSON.exists():
-        return False, None
+def read_mcp_json_config() -> "tuple[bool, Path | None, dict | None]":
+    """
+    Return (is_configured, verified_exe_path_or_None, parsed_config_or_None)
+    from .mcp.json. The parsed config can be handed to write_mcp_json so the
+    file isn't read twice.
+    """
     try:
-        cfg    = json.loads(MCP_JSON.read_text(encoding="utf-8"))
+        data = MCP_JSON.read_bytes()
+    except OSError:             # missing or unreadable
+        return False, None, None
+    cfg = None
+    try:
+        cfg    = json_io.loads(data)
         server = cfg.get("mcpServers", {}).get(MCP_NAME)
         if server:
             exe = Path(server.get("command", ""))
-            return True, (exe if exe.exists() else None)
+            return True, (exe if exe.exists() else None), cfg
     except Exception:
         pass
-    return False, None
+    return False, None, (cfg if isinstance(cfg, dict) else None)
 
 
 # ─── 2. Installation ──────────────────────────────────────────────────────────
+def _read_version_cache() -> dict:
+    """Return the cached marketplace lookup, or {} if missing/unreadable."""
+    try:
+        data = json_io.loads(VERSION_CACHE.read_bytes())
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_version_cache(**fields):
+    """Merge fields into the version cache; failures are non-fatal."""
+    data = _read_version_cache()
+    data.update(fields)
+    try:
+        VERSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        VERSION_CACHE.write_bytes(json_io.dumps(data))
+    except OSError:
+        pass
+
+
 def _fetch_latest_version() -> str:
-    """Query VS Marketplace REST API for the latest extension version."""
+    """
+    Query VS Marketplace REST API for the latest extension version.
+    A result younger than VERSION_TTL is reused from VERSION_CACHE.
+    """
+    cached = _read_version_cache()
+    try:
+        if time.time() - cached["ts"] < VERSION_TTL:
+            return cached["version"]
+    except (KeyError, TypeError):
+        pass
+
     import urllib.request
     url  = "https://marketplace.visualstudio.com/_apis/public/gallery/extensionquery"
     body = json.dumps({
@@ -98,11 +155,70 @@ def _fetch_latest_version() -> str:
     })
     with urllib.request.urlopen(req, timeout=15) as resp:
         data = json.loads(resp.read())
-    return data["results"][0]["extensions"][0]["versions"][0]["version"]
+    version = data["results"][0]["extensions"][0]["versions"][0]["version"]
+    _write_version_cache(version=version, ts=time.time())
+    return version
+
 
+def _vsix_member_path(zi: zipfile.ZipInfo) -> "Path | None":
+    """Relative output path for a member, or None if it should be skipped."""
+    if zi.is_dir() or zi.filename in _VSIX_SKIP:
+        return None
+    rel = Path(zi.filename)
+    if rel.is_absolute() or rel.drive or ".." in rel.parts:
+        return None
+    return rel
+
+
+def _extract_vsix(vsix: bytes, dest: Path) -> int:
+    """
+    Extract the needed VSIX members from the in-memory package into dest
+    across a thread pool.
+
+    zlib releases the GIL while inflating, so members decompress in
+    parallel. ZipFile handles aren't safe to share, so each worker opens
+    its own. Members with absolute or parent-relative paths are skipped,
+    as extractall would sanitise them. Returns the number of files written.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with zipfile.ZipFile(io.BytesIO(vsix), "r") as z:
+        members = [(zi, rel) for zi in z.infolist()
+                   if (rel := _vsix_member_path(zi)) is not None]
+
+    # Create each distinct output directory once, up front, instead of a
+    # mkdir per member (most members share a handful of parents)
+    for d in {(dest / rel).parent for _, rel in members}:
+        d.mkdir(parents=True, exist_ok=True)
+
+    local   = threading.local()
+    handles = []
+
+    def _extract_one(item):
+        zi, rel = item
+        z = getattr(local, "zip", None)
+        if z is None:
+            z = local.zip = zipfile.ZipFile(io.BytesIO(vsix), "r")
+            handles.append(z)
+        with z.open(zi) as src, open(dest / rel, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUF)
 
-def download_and_extract_vsix() -> "Path | None":
-    """Download the VSIX package from VS Marketplace and extract to MANUAL_DIR."""
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            list(ex.map(_extract_one, members))
+    finally:
+        for z in handles:
+            z.close()
+    return len(members)
+
+
+def download_and_extract_vsix(keep_vsix: bool = False, force: bool = False) -> "Path | None":
+    """
+    Download the VSIX package from VS Marketplace into memory and extract to
+    MANUAL_DIR. With keep_vsix, the package is also saved under temp/. With
+    force, the package is always downloaded and re-extracted.
+    """
+    import urllib.error
     import urllib.request
 
     _step("Querying VS Marketplace for latest version...")
@@ -119,69 +235,111 @@ def download_and_extract_vsix() -> "Path | None":
         f"?targetPlatform=win32-x64"
     )
 
-    Path("temp").mkdir(exist_ok=True)
-    tmp = Path("temp") / f"{MCP_EXTENSION}-{version}.vsix"
+    # Conditional GET: if this exact package was installed before and is
+    # still on disk, the server can answer 304 and we skip download+extract.
+    # --force must be able to repair a broken install, so it forgets the
+    # stored ETag and always fetches the full package.
+    exe     = MANUAL_DIR / "extension" / "server" / MCP_EXE
+    headers = {}
+    if force:
+        _write_version_cache(etag=None)
+    else:
+        cached = _read_version_cache()
+        if cached.get("etag") and cached.get("vsix_url") == vsix_url and exe.is_file():
+            headers["If-None-Match"] = cached["etag"]
 
     _step(f"Downloading package...")
     print(f"    URL: {vsix_url}")
     try:
-        def _progress(block_count, block_size, total):
-            if total > 0:
-                pct = min(block_count * block_size * 100 // total, 100)
-                print(f"\r    {pct}%  ({min(block_count * block_size, total) // 1024} / {total // 1024} KB)", end="")
-        urllib.request.urlretrieve(vsix_url, tmp, reporthook=_progress)
-        print()
-        _ok(f"Saved to {tmp}")
+        buf = io.BytesIO()
+        req = urllib.request.Request(vsix_url, headers=headers)
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            etag  = resp.headers.get("ETag")
+            total = int(resp.headers.get("Content-Length") or 0)
+            done  = 0
+            last  = time.monotonic()
+            while chunk := resp.read(_COPY_BUF):
+                buf.write(chunk)
+                done += len(chunk)
+                now = time.monotonic()
+                if total > 0 and now - last >= 0.25:   # throttle console updates
+                    print(f"\r    {min(done * 100 // total, 100)}%  ({done // 1024} / {total // 1024} KB)", end="")
+                    last = now
+        if total > 0:
+            print(f"\r    100%  ({done // 1024} / {total // 1024} KB)")
+        data = buf.getvalue()
+        _ok(f"Downloaded {len(data) // 1024} KB")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            _ok("Package unchanged since last install — skipping download")
+            return Path(os.path.abspath(exe))
+        _fail(f"Download failed: {e}")
+        return None
     except Exception as e:
         _fail(f"Download failed: {e}")
         return None
 
+    if keep_vsix:
+        Path("temp").mkdir(exist_ok=True)
+        tmp = Path("temp") / f"{MCP_EXTENSION}-{version}.vsix"
+        tmp.write_bytes(data)
+        _ok(f"Saved to {tmp}")
+
     _step(f"Extracting to {MANUAL_DIR} ...")
     MANUAL_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with zipfile.ZipFile(tmp, "r") as z:
-            z.extractall(MANUAL_DIR)
-        tmp.unlink(missing_ok=True)
-        _ok("Extracted successfully")
+        n = _extract_vsix(data, MANUAL_DIR)
+        _ok(f"Extracted successfully ({n} files)")
     except Exception as e:
         _fail(f"Extraction failed: {e}")
         return None
 
-    exe = MANUAL_DIR / "extension" / "server" / MCP_EXE
     if exe.exists():
-        return exe.resolve()
+        if etag:
+            _write_version_cache(etag=etag, vsix_url=vsix_url)
+        return Path(os.path.abspath(exe))
     _fail(f"Executable not found after extraction (expected: {exe})")
     return None
 
 
 # ─── 3. Configure .mcp.json ───────────────────────────────────────────────────
-def write_mcp_json(exe_path: Path):
-    """Merge the powerbi-modeling server entry into .mcp.json."""
-    cfg = {}
-    if MCP_JSON.exists():
+def write_mcp_json(exe_path: Path, cfg: "dict | None" = None):
+    """
+    Merge the powerbi-modeling server entry into .mcp.json.
+
+    Pass the config already parsed by read_mcp_json_config to skip re-reading
+    the file.
+    """
+    if cfg is None:
+        cfg = {}
         try:
-            cfg = json.loads(MCP_JSON.read_text(encoding="utf-8"))
+            cfg = json_io.loads(MCP_JSON.read_bytes())
         except Exception:
             pass
 
-    cfg.setdefault("mcpServers", {})[MCP_NAME] = {
+    entry = {
         "command": str(exe_path),
         "args":    ["--start", "--readonly", "--skipconfirmation"]
     }
-    MCP_JSON.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    servers = cfg.setdefault("mcpServers", {})
+    if servers.get(MCP_NAME) == entry:
+        # Rewriting an identical entry only makes editors reload the server
+        _ok(f"Already up to date: {MCP_JSON}")
+        _ok(f"Command: {exe_path}")
+        return
+    servers[MCP_NAME] = entry
+    json_io.write(MCP_JSON, cfg)
     _ok(f"Written: {MCP_JSON}")
     _ok(f"Command: {exe_path}")
 
 
 # ─── 4. User-facing messages ──────────────────────────────────────────────────
-_BOX_W = 66
+_BOX_W      = 66
+_BOX_BORDER = "+" + "-" * _BOX_W + "+"
 
 def _box(*lines):
-    border = "-" * _BOX_W
-    print(f"+{border}+")
-    for line in lines:
-        print(f"|  {line:<{_BOX_W - 2}}|")
-    print(f"+{border}+")
+    body = "\n".join(f"|  {line:<{_BOX_W - 2}}|" for line in lines)
+    print(f"{_BOX_BORDER}\n{body}\n{_BOX_BORDER}")
 
 
 def print_already_configured(exe_path: Path):
@@ -245,12 +403,14 @@ def main():
                     help="Check installation status only — no changes")
     ap.add_argument("--force", action="store_true",
                     help="Reinstall even if already configured")
+    ap.add_argument("--keep-vsix", action="store_true",
+                    help="Also save the downloaded VSIX under temp/ (debugging)")
     args = ap.parse_args()
 
     _banner("Power BI Modeling MCP  —  Setup")
 
     # ── Status snapshot ───────────────────────────────────────────────────────
-    configured, cfg_exe = read_mcp_json_config()
+    configured, cfg_exe, cfg = read_mcp_json_config()
     existing_exe        = find_installed_exe()
 
     _step("Current status")
@@ -277,13 +437,13 @@ def main():
     # ── Exe on disk but not registered ───────────────────────────────────────
     if existing_exe and not args.force:
         _step(f"Found existing installation — registering it")
-        write_mcp_json(existing_exe)
+        write_mcp_json(existing_exe, cfg=cfg)
         print_next_steps()
         return 0
 
     # ── Need to install ───────────────────────────────────────────────────────
     _step("MCP not found — downloading now")
-    exe_path = download_and_extract_vsix()
+    exe_path = download_and_extract_vsix(keep_vsix=args.keep_vsix, force=args.force)
 
     if exe_path is None:
         _fail("Could not install automatically")
@@ -293,7 +453,7 @@ def main():
 
     # ── Register ──────────────────────────────────────────────────────────────
     _step("Registering in .mcp.json")
-    write_mcp_json(exe_path)
+    write_mcp_json(exe_path, cfg=cfg)
     print_next_steps()
     return 0
 
@@ -0,0 +1,41 @@
+"""Tests for PDF page rendering resolution."""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from PIL import Image
+
+from lib.extraction import pdf_extractor
+
+
+def _make_pdf(path, title):
+    doc = fitz.open()
+    page = doc.new_page(width=720, height=405)
+    page.insert_text((36, 48), title, fontsize=24)
+    page.insert_text((36, 120), "Active users 1,234", fontsize=14)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_ordinary_page_uses_default_dpi(monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "SLIDE_TYPE_RENDER_DPI", {})
+    for title in ("Desktop usage", "Top 10 users", "Usage over time", "Page 1"):
+        assert pdf_extractor._page_render_dpi(title) == pdf_extractor.DEFAULT_RENDER_DPI
+
+
+def test_dpi_override_needs_whole_word_match(monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "SLIDE_TYPE_RENDER_DPI", {"leaderboard": 200})
+    assert pdf_extractor._page_render_dpi("Top 10 users") == 200
+    assert pdf_extractor._page_render_dpi("Desktop usage") == pdf_extractor.DEFAULT_RENDER_DPI
+
+
+def test_ordinary_page_renders_at_default_dpi(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "SLIDE_TYPE_RENDER_DPI", {"leaderboard": 200})
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, "Desktop usage")
+
+    pdf_extractor.prepare_pdf_for_analysis(str(pdf), output_dir=tmp_path / "out")
+
+    with Image.open(tmp_path / "out" / "page_1_raw.png") as img:
+        assert img.width == round(720 * pdf_extractor.DEFAULT_RENDER_DPI / 72)